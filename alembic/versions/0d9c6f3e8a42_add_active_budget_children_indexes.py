@@ -0,0 +1,42 @@
+"""add_active_budget_children_indexes
+
+Revision ID: 0d9c6f3e8a42
+Revises: b7e2d4a91c35
+Create Date: 2026-10-17 09:48:05.604712
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0d9c6f3e8a42'
+down_revision: Union[str, Sequence[str], None] = 'b7e2d4a91c35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add partial indexes for listing a budget's active containers and budget posts."""
+    op.create_index(
+        'ix_containers_budget_active',
+        'containers',
+        ['budget_id', sa.text('created_at DESC')],
+        unique=False,
+        postgresql_where='deleted_at IS NULL',
+    )
+    op.create_index(
+        'ix_budget_posts_budget_active',
+        'budget_posts',
+        ['budget_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where='deleted_at IS NULL',
+    )
+
+
+def downgrade() -> None:
+    """Drop the active containers and budget posts indexes."""
+    op.drop_index('ix_budget_posts_budget_active', table_name='budget_posts')
+    op.drop_index('ix_containers_budget_active', table_name='containers')
@@ -0,0 +1,34 @@
+"""add_budgets_owner_active_index
+
+Revision ID: b7e2d4a91c35
+Revises: feafcf9e3367
+Create Date: 2026-10-17 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2d4a91c35'
+down_revision: Union[str, Sequence[str], None] = 'feafcf9e3367'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add partial index backing keyset pagination of a user's active budgets."""
+    op.create_index(
+        'ix_budgets_owner_active',
+        'budgets',
+        ['owner_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where='deleted_at IS NULL',
+    )
+
+
+def downgrade() -> None:
+    """Drop the active budgets pagination index."""
+    op.drop_index('ix_budgets_owner_active', table_name='budgets')
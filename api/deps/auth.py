@@ -7,6 +7,7 @@ from fastapi import Cookie, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from api.deps.database import get_db
+from api.models.session import Session as SessionModel
 from api.models.user import User
 from api.services.session import validate_session
 
@@ -54,9 +55,11 @@ def get_current_user(
             detail="Session expired or invalid",
         )
 
-    # Get user (should exist due to FK constraint, but check anyway)
-    user = db.query(User).filter(
-        User.id == session.user_id,
+    # Get user (should exist due to FK constraint, but check anyway).
+    # Join through the session ID rather than reading session.user_id, which
+    # was expired by the commit in validate_session and would cost a reload.
+    user = db.query(User).join(SessionModel, SessionModel.user_id == User.id).filter(
+        SessionModel.id == session_uuid,
         User.deleted_at.is_(None),
     ).first()
 
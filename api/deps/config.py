@@ -11,6 +11,7 @@ class Settings(BaseSettings):
 
     # Security
     SECRET_KEY: str = "change-this-in-production-to-a-secure-random-key"
+    BCRYPT_ROUNDS: int = 12  # Bcrypt work factor (log2 of key-expansion rounds); tests use 4
 
     # Application
     DEBUG: bool = True
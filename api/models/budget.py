@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, BigInteger, ForeignKey, DateTime
+from sqlalchemy import String, BigInteger, ForeignKey, DateTime, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -15,6 +15,16 @@ class Budget(Base):
     """Budget for organizing containers, transactions, and financial planning."""
 
     __tablename__ = "budgets"
+    __table_args__ = (
+        # Keyset pagination of a user's active budgets (ORDER BY created_at DESC, id DESC)
+        Index(
+            'ix_budgets_owner_active',
+            'owner_id',
+            text('created_at DESC'),
+            text('id DESC'),
+            postgresql_where='deleted_at IS NULL',
+        ),
+    )
 
     # Primary key - UUID for security (no enumeration attacks)
     id: Mapped[uuid.UUID] = mapped_column(
@@ -4,7 +4,7 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, BigInteger, ForeignKey, DateTime, Enum, Integer, Boolean, UniqueConstraint, Index, Text
+from sqlalchemy import String, BigInteger, ForeignKey, DateTime, Enum, Integer, Boolean, UniqueConstraint, Index, Text, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -46,6 +46,14 @@ class BudgetPost(Base):
             unique=True,
             postgresql_where="direction = 'transfer' AND deleted_at IS NULL",
         ),
+        # Keyset pagination of a budget's active posts (ORDER BY created_at DESC, id DESC)
+        Index(
+            'ix_budget_posts_budget_active',
+            'budget_id',
+            text('created_at DESC'),
+            text('id DESC'),
+            postgresql_where='deleted_at IS NULL',
+        ),
     )
 
     # Primary key - UUID for security (no enumeration attacks)
@@ -4,7 +4,7 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, BigInteger, Boolean, ForeignKey, DateTime, Enum, Numeric, Text
+from sqlalchemy import String, BigInteger, Boolean, ForeignKey, DateTime, Enum, Numeric, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -24,6 +24,15 @@ class Container(Base):
     """Container for holding transactions within a budget."""
 
     __tablename__ = "containers"
+    __table_args__ = (
+        # Listing a budget's active containers (ORDER BY created_at DESC)
+        Index(
+            'ix_containers_budget_active',
+            'budget_id',
+            text('created_at DESC'),
+            postgresql_where='deleted_at IS NULL',
+        ),
+    )
 
     # Primary key - UUID for security (no enumeration attacks)
     id: Mapped[uuid.UUID] = mapped_column(
@@ -3,6 +3,8 @@
 import hashlib
 import bcrypt
 
+from api.deps.config import settings
+
 # Password requirements from spec
 MIN_PASSWORD_LENGTH = 12
 MAX_PASSWORD_LENGTH = 128
@@ -73,7 +75,7 @@ def hash_password(password: str) -> str:
     """
     validate_password(password)
     prepared = _prepare_password(password)
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(prepared, salt)
     return hashed.decode('utf-8')
 
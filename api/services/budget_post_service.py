@@ -7,8 +7,8 @@ from datetime import datetime, UTC, date, timedelta
 from calendar import monthrange
 from typing import Any
 
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, tuple_
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy.exc import IntegrityError
 
 from api.models.budget_post import BudgetPost, BudgetPostDirection
@@ -23,6 +23,12 @@ from api.utils.bank_days import adjust_to_bank_day, nth_bank_day_in_month
 # Sentinel value to distinguish "not provided" from "explicitly None/clear"
 _UNSET: Any = object()
 
+# Ordinal of each relative_position within a month (1-based); "last" is handled separately
+_WEEK_POSITIONS = {"first": 1, "second": 2, "third": 3, "fourth": 4}
+
+# Raised by create/update when a post's containers are not within its nearest ancestor's pool
+ANCESTOR_POOL_SUBSET_ERROR = "Budget post containers must be a subset of ancestor post's container pool"
+
 
 class BudgetPostValidationError(Exception):
     """Raised when budget post business rule validation fails."""
@@ -86,6 +92,37 @@ def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
 # NOTE: _validate_direction removed - validation logic changes with new model structure
 
 
+def _get_budget_containers(
+    db: Session,
+    budget_id: uuid.UUID,
+    container_ids: list[uuid.UUID],
+) -> dict[uuid.UUID, Container]:
+    """
+    Fetch the active containers of a budget with the given IDs in one query.
+
+    Args:
+        db: Database session
+        budget_id: Budget UUID
+        container_ids: Container UUIDs to look up
+
+    Returns:
+        Dict of container ID to Container; IDs that are missing, deleted or
+        belong to another budget are absent
+    """
+    if not container_ids:
+        return {}
+
+    containers = db.query(Container).filter(
+        and_(
+            Container.id.in_(container_ids),
+            Container.budget_id == budget_id,
+            Container.deleted_at.is_(None),
+        )
+    ).all()
+
+    return {container.id: container for container in containers}
+
+
 def _find_nearest_ancestor_post(
     db: Session,
     budget_id: uuid.UUID,
@@ -278,24 +315,20 @@ def create_budget_post(
             )
 
         # Verify all containers exist, belong to budget, and enforce mutual exclusivity
-        non_cashbox_count = 0
-        cashbox_count = 0
+        cont_uuids = []
         for cont_id in container_ids:
             try:
-                cont_uuid = uuid.UUID(cont_id)
+                cont_uuids.append(uuid.UUID(cont_id))
             except (ValueError, TypeError):
                 raise BudgetPostValidationError(
                     f"Invalid container_id format: {cont_id}"
                 )
 
-            container = db.query(Container).filter(
-                and_(
-                    Container.id == cont_uuid,
-                    Container.budget_id == budget_id,
-                    Container.deleted_at.is_(None),
-                )
-            ).first()
-
+        pool_containers = _get_budget_containers(db, budget_id, cont_uuids)
+        non_cashbox_count = 0
+        cashbox_count = 0
+        for cont_uuid in cont_uuids:
+            container = pool_containers.get(cont_uuid)
             if not container:
                 return None, []
 
@@ -350,9 +383,7 @@ def create_budget_post(
             if ancestor and ancestor.container_ids:
                 # Validate that this post's containers are a subset of ancestor's pool
                 if not set(container_ids).issubset(set(ancestor.container_ids)):
-                    raise BudgetPostValidationError(
-                        "Budget post containers must be a subset of ancestor post's container pool"
-                    )
+                    raise BudgetPostValidationError(ANCESTOR_POOL_SUBSET_ERROR)
 
         # Via container validation
         if via_container_id:
@@ -526,7 +557,8 @@ def get_budget_posts(
     Returns:
         Tuple of (list of budget posts, next cursor or None)
     """
-    query = db.query(BudgetPost).filter(
+    # Every caller reads amount_patterns; load them in one SELECT for the whole page
+    query = db.query(BudgetPost).options(selectinload(BudgetPost.amount_patterns)).filter(
         and_(
             BudgetPost.budget_id == budget_id,
             BudgetPost.deleted_at.is_(None),
@@ -537,14 +569,9 @@ def get_budget_posts(
     if cursor:
         try:
             cursor_created_at, cursor_id = decode_cursor(cursor)
+            # Row comparison lets Postgres seek ix_budget_posts_budget_active
             query = query.filter(
-                or_(
-                    BudgetPost.created_at < cursor_created_at,
-                    and_(
-                        BudgetPost.created_at == cursor_created_at,
-                        BudgetPost.id < cursor_id,
-                    ),
-                )
+                tuple_(BudgetPost.created_at, BudgetPost.id) < tuple_(cursor_created_at, cursor_id)
             )
         except ValueError:
             # Invalid cursor - ignore and start from beginning
@@ -582,7 +609,7 @@ def get_budget_post_by_id(
     Returns:
         BudgetPost instance or None if not found
     """
-    return db.query(BudgetPost).filter(
+    return db.query(BudgetPost).options(selectinload(BudgetPost.amount_patterns)).filter(
         and_(
             BudgetPost.id == post_id,
             BudgetPost.budget_id == budget_id,
@@ -648,24 +675,20 @@ def update_budget_post(
             )
 
         # Verify all containers exist, belong to budget, and enforce mutual exclusivity
-        non_cashbox_count = 0
-        cashbox_count = 0
+        cont_uuids = []
         for cont_id in container_ids:
             try:
-                cont_uuid = uuid.UUID(cont_id)
+                cont_uuids.append(uuid.UUID(cont_id))
             except (ValueError, TypeError):
                 raise BudgetPostValidationError(
                     f"Invalid container_id format: {cont_id}"
                 )
 
-            container = db.query(Container).filter(
-                and_(
-                    Container.id == cont_uuid,
-                    Container.budget_id == budget_id,
-                    Container.deleted_at.is_(None),
-                )
-            ).first()
-
+        pool_containers = _get_budget_containers(db, budget_id, cont_uuids)
+        non_cashbox_count = 0
+        cashbox_count = 0
+        for cont_uuid in cont_uuids:
+            container = pool_containers.get(cont_uuid)
             if not container:
                 return None, []
 
@@ -699,9 +722,7 @@ def update_budget_post(
                 if ancestor and ancestor.container_ids:
                     # Validate that new containers are a subset of ancestor's pool
                     if not set(container_ids).issubset(set(ancestor.container_ids)):
-                        raise BudgetPostValidationError(
-                            "Budget post containers must be a subset of ancestor post's container pool"
-                        )
+                        raise BudgetPostValidationError(ANCESTOR_POOL_SUBSET_ERROR)
 
     # Validate via_container_id changes if provided
     if via_container_id is not _UNSET and via_container_id is not None:
@@ -746,21 +767,18 @@ def update_budget_post(
         effective_container_ids = container_ids if container_ids is not None else budget_post.container_ids
         if effective_container_ids:
             # Count non-cashbox containers in the effective pool
-            effective_non_cashbox_count = 0
+            effective_uuids = []
             for cont_id in effective_container_ids:
                 try:
-                    cont_uuid = uuid.UUID(cont_id)
-                    container = db.query(Container).filter(
-                        and_(
-                            Container.id == cont_uuid,
-                            Container.budget_id == budget_id,
-                            Container.deleted_at.is_(None),
-                        )
-                    ).first()
-                    if container and container.type != ContainerType.CASHBOX:
-                        effective_non_cashbox_count += 1
+                    effective_uuids.append(uuid.UUID(cont_id))
                 except (ValueError, TypeError):
                     pass
+            pool_containers = _get_budget_containers(db, budget_id, effective_uuids)
+            effective_non_cashbox_count = 0
+            for cont_uuid in effective_uuids:
+                container = pool_containers.get(cont_uuid)
+                if container and container.type != ContainerType.CASHBOX:
+                    effective_non_cashbox_count += 1
 
             # Via container only allowed with non-cashbox containers
             if effective_non_cashbox_count == 0:
@@ -836,9 +854,7 @@ def update_budget_post(
                 ancestor = _find_nearest_ancestor_post(db, budget_id, direction, category_path)
                 if ancestor and ancestor.container_ids:
                     if not set(effective_container_ids).issubset(set(ancestor.container_ids)):
-                        raise BudgetPostValidationError(
-                            "Budget post containers must be a subset of ancestor post's container pool"
-                        )
+                        raise BudgetPostValidationError(ANCESTOR_POOL_SUBSET_ERROR)
 
         budget_post.category_path = category_path
 
@@ -960,8 +976,7 @@ def _get_nth_weekday(year: int, month: int, weekday: int, position: str) -> date
         return last_day - timedelta(days=days_back)
 
     # For first/second/third/fourth: find the Nth occurrence
-    position_map = {"first": 1, "second": 2, "third": 3, "fourth": 4}
-    n = position_map.get(position)
+    n = _WEEK_POSITIONS.get(position)
     if n is None:
         return None
 
@@ -1166,7 +1181,7 @@ def _expand_recurrence_pattern(
         while current <= end_date:
             if bank_day_adj != "none":
                 adjusted = adjust_to_bank_day(current, bank_day_adj, keep_in_month=keep_in_month)
-                if adjusted <= end_date and (no_dedup or adjusted not in occurrences):
+                if adjusted <= end_date:
                     occurrences.append(adjusted)
             else:
                 occurrences.append(current)
@@ -1193,14 +1208,18 @@ def _expand_recurrence_pattern(
             else:
                 current = first_occ
 
-            while current <= end_date:
-                if bank_day_adj != "none":
-                    adjusted = adjust_to_bank_day(current, bank_day_adj, keep_in_month=keep_in_month)
-                    if adjusted <= end_date and (no_dedup or adjusted not in occurrences):
+            # Generate the date sequence directly instead of stepping through a loop
+            step_days = 7 * interval
+            count = (end_date - current).days // step_days + 1 if current <= end_date else 0
+            candidates = [current + timedelta(days=step_days * i) for i in range(count)]
+
+            if bank_day_adj != "none":
+                for candidate in candidates:
+                    adjusted = adjust_to_bank_day(candidate, bank_day_adj, keep_in_month=keep_in_month)
+                    if adjusted <= end_date:
                         occurrences.append(adjusted)
-                else:
-                    occurrences.append(current)
-                current += timedelta(weeks=interval)
+            else:
+                occurrences.extend(candidates)
 
     elif recurrence_type == RecurrenceType.MONTHLY_FIXED.value:
         # Every N months on specific day of month - anchor phase to pattern_start
@@ -1208,27 +1227,21 @@ def _expand_recurrence_pattern(
         if day_of_month is not None:
             anchor = pattern_start if pattern_start is not None else start_date
 
-            # Start from the anchor month for phase alignment
-            current_year = anchor.year
-            current_month = anchor.month
+            # Work on absolute month indices (year * 12 + month - 1) for phase alignment
+            anchor_index = anchor.year * 12 + anchor.month - 1
+            end_index = end_date.year * 12 + end_date.month - 1
 
             # Skip forward to first occurrence on or after start_date (performance optimization)
+            first_index = anchor_index
             if anchor < start_date:
-                # Calculate total months elapsed
-                months_diff = (start_date.year - anchor.year) * 12 + (start_date.month - anchor.month)
-                skip_periods = months_diff // interval
-                # Fast-forward to that period
-                current_month = anchor.month + skip_periods * interval
-                current_year = anchor.year
-                while current_month > 12:
-                    current_month -= 12
-                    current_year += 1
+                months_diff = (start_date.year * 12 + start_date.month - 1) - anchor_index
+                first_index = anchor_index + (months_diff // interval) * interval
 
-            while True:
-                # Get last day of current month
-                last_day = monthrange(current_year, current_month)[1]
+            for month_index in range(first_index, end_index + 1, interval):
+                current_year, month_offset = divmod(month_index, 12)
+                current_month = month_offset + 1
                 # Use min to handle months with fewer days (e.g., Feb 31 -> Feb 28/29)
-                actual_day = min(day_of_month, last_day)
+                actual_day = min(day_of_month, monthrange(current_year, current_month)[1])
                 occurrence = date(current_year, current_month, actual_day)
 
                 if occurrence > end_date:
@@ -1237,17 +1250,11 @@ def _expand_recurrence_pattern(
                 if occurrence >= start_date:
                     if bank_day_adj != "none":
                         adjusted = adjust_to_bank_day(occurrence, bank_day_adj, keep_in_month=keep_in_month)
-                        if adjusted <= end_date and (no_dedup or adjusted not in occurrences):
+                        if adjusted <= end_date:
                             occurrences.append(adjusted)
                     else:
                         occurrences.append(occurrence)
 
-                # Move to next interval
-                current_month += interval
-                while current_month > 12:
-                    current_month -= 12
-                    current_year += 1
-
     elif recurrence_type == RecurrenceType.MONTHLY_RELATIVE.value:
         # Every N months on nth weekday (first/second/third/fourth/last) - anchor phase to pattern_start
         weekday = pattern.get("weekday")
@@ -1281,7 +1288,7 @@ def _expand_recurrence_pattern(
                 if occurrence >= start_date:
                     if bank_day_adj != "none":
                         adjusted = adjust_to_bank_day(occurrence, bank_day_adj, keep_in_month=keep_in_month)
-                        if adjusted <= end_date and (no_dedup or adjusted not in occurrences):
+                        if adjusted <= end_date:
                             occurrences.append(adjusted)
                     else:
                         occurrences.append(occurrence)
@@ -1382,7 +1389,7 @@ def _expand_recurrence_pattern(
                 if occurrence >= start_date:
                     if bank_day_adj != "none":
                         adjusted = adjust_to_bank_day(occurrence, bank_day_adj, keep_in_month=keep_in_month)
-                        if adjusted <= end_date and (no_dedup or adjusted not in occurrences):
+                        if adjusted <= end_date:
                             occurrences.append(adjusted)
                     else:
                         occurrences.append(occurrence)
@@ -1456,7 +1463,7 @@ def _expand_recurrence_pattern(
             if occurrence >= start_date:
                 if bank_day_adj != "none":
                     adjusted = adjust_to_bank_day(occurrence, bank_day_adj, keep_in_month=keep_in_month)
-                    if adjusted <= end_date and (no_dedup or adjusted not in occurrences):
+                    if adjusted <= end_date:
                         occurrences.append(adjusted)
                 else:
                     occurrences.append(occurrence)
@@ -1490,7 +1497,7 @@ def _expand_recurrence_pattern(
                 if occurrence >= start_date:
                     if bank_day_adj != "none":
                         adjusted = adjust_to_bank_day(occurrence, bank_day_adj, keep_in_month=keep_in_month)
-                        if adjusted <= end_date and (no_dedup or adjusted not in occurrences):
+                        if adjusted <= end_date:
                             occurrences.append(adjusted)
                     else:
                         occurrences.append(occurrence)
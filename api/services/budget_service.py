@@ -5,8 +5,8 @@ import json
 import uuid
 from datetime import datetime, UTC
 
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session, raiseload
 
 from api.models.budget import Budget
 
@@ -108,7 +108,8 @@ def get_user_budgets(
     Returns:
         Tuple of (list of budgets, next cursor or None)
     """
-    query = db.query(Budget).filter(
+    # Only column data is serialized; raiseload turns any relationship access into an error
+    query = db.query(Budget).options(raiseload("*")).filter(
         Budget.owner_id == user_id,
         Budget.deleted_at.is_(None),
     )
@@ -117,15 +118,9 @@ def get_user_budgets(
     if cursor:
         try:
             cursor_created_at, cursor_id = decode_cursor(cursor)
-            # For descending order: (created_at < cursor_created_at) OR (created_at = cursor_created_at AND id < cursor_id)
+            # For descending order: row comparison lets Postgres seek ix_budgets_owner_active
             query = query.filter(
-                or_(
-                    Budget.created_at < cursor_created_at,
-                    and_(
-                        Budget.created_at == cursor_created_at,
-                        Budget.id < cursor_id,
-                    ),
-                )
+                tuple_(Budget.created_at, Budget.id) < tuple_(cursor_created_at, cursor_id)
             )
         except ValueError:
             # Invalid cursor, return empty result
@@ -78,7 +78,6 @@ def validate_session(db: DBSession, session_id: uuid.UUID) -> Session | None:
     session.last_activity = now
     session.expires_at = now + timedelta(days=SESSION_LIFETIME_DAYS)
     db.commit()
-    db.refresh(session)
 
     return session
 
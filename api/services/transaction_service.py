@@ -6,7 +6,8 @@ import uuid
 from datetime import date, datetime
 
 from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager, joinedload, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
 
 from api.models.transaction import Transaction, TransactionStatus
 from api.models.container import Container
@@ -243,6 +244,7 @@ def get_transaction_by_id(
     db: Session,
     transaction_id: uuid.UUID,
     budget_id: uuid.UUID,
+    *options: ORMOption,
 ) -> Transaction | None:
     """
     Get a single transaction by ID.
@@ -251,11 +253,12 @@ def get_transaction_by_id(
         db: Database session
         transaction_id: Transaction ID to retrieve
         budget_id: Budget ID (for authorization check)
+        *options: Optional loader options applied to the query
 
     Returns:
         Transaction if found and belongs to budget, None otherwise
     """
-    return db.query(Transaction).join(Container).filter(
+    return db.query(Transaction).join(Container).options(*options).filter(
         Transaction.id == transaction_id,
         Container.budget_id == budget_id,
         Container.deleted_at.is_(None),
@@ -326,13 +329,24 @@ def delete_transaction(
     Returns:
         True if transaction was deleted, False if not found or not in budget
     """
-    transaction = get_transaction_by_id(db, transaction_id, budget_id)
+    # The delete flush needs container (delete-orphan backref) and allocations (cascade);
+    # load them with the row instead of one lazy SELECT each during flush
+    transaction = get_transaction_by_id(
+        db,
+        transaction_id,
+        budget_id,
+        contains_eager(Transaction.container),
+        selectinload(Transaction.allocations),
+    )
     if not transaction:
         return False
 
     # If internal transfer, also delete counterpart
     if transaction.is_internal_transfer and transaction.counterpart_transaction_id:
-        counterpart = db.query(Transaction).filter(
+        counterpart = db.query(Transaction).options(
+            joinedload(Transaction.container),
+            selectinload(Transaction.allocations),
+        ).filter(
             Transaction.id == transaction.counterpart_transaction_id
         ).first()
 
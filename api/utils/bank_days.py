@@ -90,9 +90,9 @@ class DanishHolidayCalendar(HolidayCalendar):
         return holidays
 
 
-# Registry of holiday calendars by country code
-CALENDARS: dict[str, type[HolidayCalendar]] = {
-    "DK": DanishHolidayCalendar,
+# Registry of holiday calendar instances by country code (calendars are stateless)
+CALENDARS: dict[str, HolidayCalendar] = {
+    "DK": DanishHolidayCalendar(),
 }
 
 
@@ -113,9 +113,7 @@ def _get_holidays(year: int, country: str = "DK") -> frozenset[date]:
     if country not in CALENDARS:
         raise KeyError(f"Unsupported country code: {country}")
 
-    calendar_class = CALENDARS[country]
-    calendar = calendar_class()
-    return frozenset(calendar.get_holidays(year))
+    return frozenset(CALENDARS[country].get_holidays(year))
 
 
 def is_bank_day(d: date, country: str = "DK") -> bool:
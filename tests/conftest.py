@@ -1,11 +1,14 @@
 """Pytest configuration and shared fixtures."""
 
+import os
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 
-import bcrypt
+import httpx
 import pytest
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, raiseload, sessionmaker
 from fastapi.testclient import TestClient
 
 from api.models.base import Base
@@ -13,6 +16,7 @@ from api.models.user import User
 from api.models.session import Session as SessionModel
 from api.services.auth import hash_password
 from api.main import app
+from api.deps.auth import get_current_user
 from api.deps.database import get_db
 from api.deps.config import settings
 
@@ -24,15 +28,24 @@ from api.deps.config import settings
 # Enable testing mode to disable secure cookies
 settings.TESTING = True
 
-# Reduce bcrypt rounds from default 12 to 4 (minimum) for test speed.
-# Each hash goes from ~250ms to ~15ms. Does not affect correctness.
-_original_gensalt = bcrypt.gensalt
-bcrypt.gensalt = lambda rounds=4, prefix=b"2b": _original_gensalt(rounds=rounds, prefix=prefix)
+# Reduce bcrypt rounds from 12 to 4 (minimum) for test speed.
+# Each hash goes from ~250ms to ~15ms. Hash format and verification are unchanged.
+settings.BCRYPT_ROUNDS = 4
 
 # Ensure psycopg3 dialect is used
 _test_db_url = settings.DATABASE_URL
 if _test_db_url.startswith("postgresql://"):
     _test_db_url = _test_db_url.replace("postgresql://", "postgresql+psycopg://", 1)
+
+# Under pytest-xdist, give each worker its own database. Workers sharing one
+# database would block each other on unique constraints (e.g. user email)
+# held by the open per-test transactions.
+_xdist_worker = os.environ.get("PYTEST_XDIST_WORKER")
+if _xdist_worker:
+    _base_url = make_url(_test_db_url)
+    _test_db_url = _base_url.set(database=f"{_base_url.database}_{_xdist_worker}").render_as_string(
+        hide_password=False
+    )
 TEST_DATABASE_URL = _test_db_url
 
 
@@ -40,10 +53,35 @@ TEST_DATABASE_URL = _test_db_url
 # Session-scoped fixtures (once per test run)
 # ---------------------------------------------------------------------------
 
+def _ensure_worker_database():
+    """Create this xdist worker's database if it does not exist yet."""
+    worker_url = make_url(TEST_DATABASE_URL)
+    admin_engine = create_engine(
+        worker_url.set(database=make_url(settings.DATABASE_URL).database),
+        isolation_level="AUTOCOMMIT",
+    )
+    with admin_engine.connect() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM pg_database WHERE datname = :name"),
+            {"name": worker_url.database},
+        ).scalar()
+        if not exists:
+            conn.execute(text(f'CREATE DATABASE "{worker_url.database}"'))
+    admin_engine.dispose()
+
+
 @pytest.fixture(scope="session")
 def engine():
-    """Create a test database engine."""
-    return create_engine(TEST_DATABASE_URL, echo=False, pool_pre_ping=True)
+    """
+    Create a test database engine.
+
+    Each test checks out one pooled connection, so skip pool_pre_ping: the
+    liveness probe would cost an extra round-trip per test against a server
+    that stays up for the whole run.
+    """
+    if _xdist_worker:
+        _ensure_worker_database()
+    return create_engine(TEST_DATABASE_URL, echo=False, pool_pre_ping=False)
 
 
 @pytest.fixture(scope="session")
@@ -53,6 +91,12 @@ def tables(engine):
     yield
 
 
+@pytest.fixture(scope="session")
+def _shared_client():
+    """Single TestClient instance shared across the test run."""
+    return TestClient(app)
+
+
 @pytest.fixture(scope="session")
 def _test_password_hash():
     """Compute the bcrypt hash once per test run, reused by all test_user fixtures."""
@@ -65,6 +109,34 @@ def _other_password_hash():
     return hash_password("SecurePassword123!")
 
 
+@pytest.fixture(scope="session")
+def _seed_users(engine, tables, _test_password_hash, _other_password_hash):
+    """
+    Commit test_user / other_user once per run and return their ids by email.
+
+    These rows live outside the per-test transactions, so rollbacks leave them
+    intact. Existing rows from an earlier run are reset instead of re-inserted.
+    """
+    seeds = {
+        "testuser@example.com": _test_password_hash,
+        "otheruser@example.com": _other_password_hash,
+    }
+    ids = {}
+    with Session(engine) as session:
+        for email, password_hash in seeds.items():
+            user = session.query(User).filter(User.email == email).first()
+            if user is None:
+                user = User(email=email)
+                session.add(user)
+            user.password_hash = password_hash
+            user.email_verified = True
+            user.deleted_at = None
+            session.flush()
+            ids[email] = user.id
+        session.commit()
+    return ids
+
+
 # ---------------------------------------------------------------------------
 # Function-scoped fixtures (per test, with transaction rollback isolation)
 # ---------------------------------------------------------------------------
@@ -74,8 +146,13 @@ def db(engine, tables):
     """
     Provide a database session for each test.
 
-    Uses a connection-level transaction + session-level savepoint.
-    session.commit() only releases the savepoint (not the real transaction).
+    Uses a connection-level transaction joined by the session in
+    "create_savepoint" mode: every session-level transaction runs inside a
+    SAVEPOINT, so session.commit() / session.rollback() (including those
+    issued by route and service code) never touch the real transaction.
+    Relationships must be eager-loaded; an implicit lazy load raises.
+    Commits do not expire loaded objects, so fixtures need no refresh() after
+    commit (route code runs in this same session and sees the same instances).
     At teardown, the connection transaction is rolled back, cleaning up all data.
     """
     connection = engine.connect()
@@ -85,16 +162,22 @@ def db(engine, tables):
         bind=connection,
         autocommit=False,
         autoflush=False,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
     )()
 
-    # Start a savepoint so session.commit() releases the savepoint,
-    # not the outer connection transaction.
-    session.begin_nested()
-
-    @event.listens_for(session, "after_transaction_end")
-    def restart_savepoint(sess, trans):
-        if trans.nested and not trans._parent.nested:
-            sess.begin_nested()
+    @event.listens_for(session, "do_orm_execute")
+    def _raise_on_lazy_load(orm_execute_state):
+        # Objects from top-level SELECTs raise instead of lazy loading a relationship,
+        # so an N+1 in a route or service fails the test rather than passing slowly.
+        if (
+            orm_execute_state.is_select
+            and not orm_execute_state.is_column_load
+            and not orm_execute_state.is_relationship_load
+        ):
+            orm_execute_state.statement = orm_execute_state.statement.options(
+                raiseload("*", sql_only=True)
+            )
 
     yield session
 
@@ -103,6 +186,36 @@ def db(engine, tables):
     connection.close()
 
 
+@pytest.fixture
+def count_queries(db):
+    """
+    Count SQL statements issued on the test connection.
+
+    Returns a context manager yielding the list of captured statements.
+    SAVEPOINT bookkeeping from the db fixture is not counted.
+
+        with count_queries() as queries:
+            client.get("/api/auth/me")
+        assert len(queries) <= 3
+    """
+    @contextmanager
+    def _count_queries():
+        queries: list[str] = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if "SAVEPOINT" not in statement.upper():
+                queries.append(statement)
+
+        connection = db.connection()
+        event.listen(connection, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield queries
+        finally:
+            event.remove(connection, "before_cursor_execute", before_cursor_execute)
+
+    return _count_queries
+
+
 def _create_auth_session(db_session, user):
     """
     Create a session record directly in DB (bypasses bcrypt verify).
@@ -121,59 +234,88 @@ def _create_auth_session(db_session, user):
 
 
 @pytest.fixture
-def test_user(db, _test_password_hash):
-    """Shared test user - uses pre-computed hash (no bcrypt per test)."""
-    user = User(
-        email="testuser@example.com",
-        password_hash=_test_password_hash,
-        email_verified=True,
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    return user
+def test_user(db, _seed_users):
+    """Shared test user, seeded once per run (see _seed_users)."""
+    return db.get(User, _seed_users["testuser@example.com"])
 
 
 @pytest.fixture
-def other_user(db, _other_password_hash):
-    """Second user for ownership/authorization tests - uses pre-computed hash."""
-    user = User(
-        email="otheruser@example.com",
-        password_hash=_other_password_hash,
-        email_verified=True,
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    return user
+def other_user(db, _seed_users):
+    """Second user for ownership/authorization tests, seeded once per run."""
+    return db.get(User, _seed_users["otheruser@example.com"])
 
 
 @pytest.fixture
-def client(db):
-    """Test client with DB dependency override."""
-    def override_get_db():
-        try:
-            yield db
-        finally:
-            pass
+def user_factory(db, _test_password_hash):
+    """
+    Factory that inserts users directly in the DB (no HTTP, no bcrypt per call).
+
+    Users get the pre-computed hash of "SecurePassword123!". Use it when a test
+    only needs an existing account, not the registration endpoint itself.
+    """
+    def _make_user(email: str) -> User:
+        user = User(
+            email=email.lower(),
+            password_hash=_test_password_hash,
+            email_verified=True,
+        )
+        db.add(user)
+        db.flush()
+        return user
 
-    app.dependency_overrides[get_db] = override_get_db
-    c = TestClient(app)
-    yield c
-    app.dependency_overrides.clear()
+    return _make_user
+
+
+@pytest.fixture
+def client(_shared_client, db):
+    """
+    Test client with DB dependency override.
+
+    Reuses the session-wide TestClient; only the get_db override and the
+    cookie jar are reset per test.
+    """
+    app.dependency_overrides[get_db] = lambda: db
+    yield _shared_client
+    app.dependency_overrides.pop(get_db, None)
+    _shared_client.cookies.clear()
+
+
+@pytest.fixture
+async def async_client(db):
+    """
+    Async HTTP client driving the app in-process via httpx.ASGITransport.
+
+    Runs on the session-wide event loop (see pytest config) instead of the
+    per-request portal thread that TestClient uses.
+    """
+    app.dependency_overrides[get_db] = lambda: db
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        yield ac
+    app.dependency_overrides.pop(get_db, None)
 
 
 @pytest.fixture
 def authenticated_client(client, db, test_user):
     """
-    Authenticated test client (cookie-based).
+    Authenticated test client.
 
-    Creates session directly in DB - no bcrypt verify needed.
+    Overrides get_current_user to return test_user, so requests skip the
+    session and user lookups. Tests of the cookie/session path itself use
+    auth_headers instead.
     Used by tests that call `authenticated_client.get(...)`.
     """
-    session_id = _create_auth_session(db, test_user)
-    client.cookies.set("session_id", session_id)
-    return client
+    app.dependency_overrides[get_current_user] = lambda: test_user
+    yield client
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+@pytest.fixture
+async def authenticated_async_client(async_client, test_user):
+    """Async counterpart of authenticated_client: get_current_user returns test_user."""
+    app.dependency_overrides[get_current_user] = lambda: test_user
+    yield async_client
+    app.dependency_overrides.pop(get_current_user, None)
 
 
 @pytest.fixture
@@ -26,7 +26,6 @@ def test_budget(db: Session, test_user: User) -> Budget:
     )
     db.add(budget)
     db.commit()
-    db.refresh(budget)
     return budget
 
 
@@ -45,7 +44,6 @@ def test_container(db: Session, test_budget: Budget, test_user: User) -> Contain
     )
     db.add(container)
     db.commit()
-    db.refresh(container)
     return container
 
 
@@ -1,5 +1,7 @@
 """Tests for amount pattern functionality."""
 
+from collections import Counter
+from itertools import cycle
 from datetime import date
 from uuid import uuid4
 import pytest
@@ -13,6 +15,15 @@ from api.models.amount_pattern import AmountPattern
 from api.services.budget_post_service import expand_amount_patterns_to_occurrences
 
 
+# Pre-generated container ids for tests that never assert on the specific value
+_DUMMY_CONTAINER_IDS = cycle([str(uuid4()) for _ in range(8)])
+
+
+def dummy_container_id() -> str:
+    """Return a pre-generated container id string."""
+    return next(_DUMMY_CONTAINER_IDS)
+
+
 class TestAmountPatternModel:
     """Test amount pattern model and relationships."""
 
@@ -33,7 +44,7 @@ class TestAmountPatternModel:
         display_order=[0, 0],
             direction=BudgetPostDirection.EXPENSE,
             accumulate=False,
-            container_ids=[str(uuid4())],  # Dummy account for expense
+            container_ids=[dummy_container_id()],  # Dummy account for expense
         )
         db.add(budget_post)
         db.commit()
@@ -75,7 +86,7 @@ class TestAmountPatternModel:
         display_order=[0, 0],
             direction=BudgetPostDirection.EXPENSE,
             accumulate=False,
-            container_ids=[str(uuid4())],  # Dummy account for expense
+            container_ids=[dummy_container_id()],  # Dummy account for expense
         )
         db.add(budget_post)
         db.commit()
@@ -101,9 +112,9 @@ class TestAmountPatternModel:
         # Refresh budget_post to load relationship
         db.refresh(budget_post)
 
+        pattern_ids = {p.id for p in budget_post.amount_patterns}
         assert len(budget_post.amount_patterns) == 2
-        assert pattern1 in budget_post.amount_patterns
-        assert pattern2 in budget_post.amount_patterns
+        assert pattern_ids == {pattern1.id, pattern2.id}
 
     def test_cascade_delete(self, db: Session):
         """Test that deleting budget post cascades to amount patterns."""
@@ -122,7 +133,7 @@ class TestAmountPatternModel:
         display_order=[0, 0],
             direction=BudgetPostDirection.EXPENSE,
             accumulate=False,
-            container_ids=[str(uuid4())],  # Dummy account for expense
+            container_ids=[dummy_container_id()],  # Dummy account for expense
         )
         db.add(budget_post)
         db.commit()
@@ -142,7 +153,7 @@ class TestAmountPatternModel:
         db.commit()
 
         # Pattern should also be deleted
-        deleted_pattern = db.query(AmountPattern).filter(AmountPattern.id == pattern_id).first()
+        deleted_pattern = db.get(AmountPattern, pattern_id)
         assert deleted_pattern is None
 
 
@@ -162,7 +173,7 @@ class TestOccurrenceExpansionWithPatterns:
             display_order=[0, 0],
             direction=BudgetPostDirection.EXPENSE,
             accumulate=False,
-            container_ids=[str(uuid4())],  # Dummy account for expense
+            container_ids=[dummy_container_id()],  # Dummy account for expense
         )
 
         pattern = AmountPattern(
@@ -200,7 +211,7 @@ class TestOccurrenceExpansionWithPatterns:
             display_order=[0, 0],
             direction=BudgetPostDirection.EXPENSE,
             accumulate=False,
-            container_ids=[str(uuid4())],  # Dummy account for expense
+            container_ids=[dummy_container_id()],  # Dummy account for expense
         )
 
         pattern1 = AmountPattern(
@@ -238,15 +249,9 @@ class TestOccurrenceExpansionWithPatterns:
         # February 2026 has 4 Mondays, March has 5 Mondays
         assert len(occurrences) == 9
 
-        # First 4 should be 30000
-        february_occurrences = [occ for occ in occurrences if occ[0].month == 2]
-        assert len(february_occurrences) == 4
-        assert all(amount == 30000 for _, amount in february_occurrences)
-
-        # Last 5 should be 40000
-        march_occurrences = [occ for occ in occurrences if occ[0].month == 3]
-        assert len(march_occurrences) == 5
-        assert all(amount == 40000 for _, amount in march_occurrences)
+        # February occurrences should be 30000, March occurrences 40000
+        buckets = Counter((occ_date.month, amount) for occ_date, amount in occurrences)
+        assert buckets == Counter({(2, 30000): 4, (3, 40000): 5})
 
     def test_expand_salary_increase_scenario(self):
         """Test realistic scenario: salary increase mid-year."""
@@ -257,7 +262,7 @@ class TestOccurrenceExpansionWithPatterns:
             display_order=[0, 0],
             direction=BudgetPostDirection.EXPENSE,
             accumulate=False,
-            container_ids=[str(uuid4())],  # Dummy account for expense
+            container_ids=[dummy_container_id()],  # Dummy account for expense
         )
 
         # Salary before increase
@@ -297,15 +302,10 @@ class TestOccurrenceExpansionWithPatterns:
         # 11 months = 11 salary payments (Feb-Dec)
         assert len(occurrences) == 11
 
-        # First 4 months (Feb-May) should be 45,000 kr
-        first_half = [occ for occ in occurrences if 2 <= occ[0].month <= 5]
-        assert len(first_half) == 4
-        assert all(amount == 4500000 for _, amount in first_half)
-
-        # Last 7 months (Jun-Dec) should be 48,000 kr
-        second_half = [occ for occ in occurrences if occ[0].month >= 6]
-        assert len(second_half) == 7
-        assert all(amount == 4800000 for _, amount in second_half)
+        # Feb-May should be 45,000 kr, Jun-Dec should be 48,000 kr
+        buckets = Counter((occ_date.month, amount) for occ_date, amount in occurrences)
+        expected = Counter({(month, 4500000 if month <= 5 else 4800000): 1 for month in range(2, 13)})
+        assert buckets == expected
 
     def test_expand_seasonal_electricity_scenario(self):
         """Test realistic scenario: seasonal electricity costs."""
@@ -316,7 +316,7 @@ class TestOccurrenceExpansionWithPatterns:
             display_order=[0, 0],
             direction=BudgetPostDirection.EXPENSE,
             accumulate=False,
-            container_ids=[str(uuid4())],  # Dummy account for expense
+            container_ids=[dummy_container_id()],  # Dummy account for expense
         )
 
         # Winter months (higher consumption)
@@ -369,20 +369,10 @@ class TestOccurrenceExpansionWithPatterns:
         # 11 months = 11 bills (Feb-Dec)
         assert len(occurrences) == 11
 
-        # Feb-Mar: winter rates
-        winter1 = [occ for occ in occurrences if 2 <= occ[0].month <= 3]
-        assert len(winter1) == 2
-        assert all(amount == 150000 for _, amount in winter1)
-
-        # Apr-Sep: summer rates
-        summer = [occ for occ in occurrences if 4 <= occ[0].month <= 9]
-        assert len(summer) == 6
-        assert all(amount == 80000 for _, amount in summer)
-
-        # Oct-Dec: winter rates again
-        winter2 = [occ for occ in occurrences if 10 <= occ[0].month <= 12]
-        assert len(winter2) == 3
-        assert all(amount == 150000 for _, amount in winter2)
+        # Feb-Mar and Oct-Dec: winter rates, Apr-Sep: summer rates
+        buckets = Counter((occ_date.month, amount) for occ_date, amount in occurrences)
+        expected = Counter({(month, 80000 if 4 <= month <= 9 else 150000): 1 for month in range(2, 13)})
+        assert buckets == expected
 
     def test_empty_patterns_returns_empty(self):
         """Test that expansion with no patterns returns empty list."""
@@ -393,7 +383,7 @@ class TestOccurrenceExpansionWithPatterns:
             display_order=[0, 0],
             direction=BudgetPostDirection.EXPENSE,
             accumulate=False,
-            container_ids=[str(uuid4())],  # Dummy account for expense
+            container_ids=[dummy_container_id()],  # Dummy account for expense
         )
         # No amount_patterns - should return empty
         budget_post.amount_patterns = []
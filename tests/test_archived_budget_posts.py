@@ -1,7 +1,7 @@
 """Tests for archived budget posts functionality."""
 
 import pytest
-from datetime import date
+from datetime import date, datetime, UTC
 from uuid import uuid4
 
 from sqlalchemy.orm import Session
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 from api.models.budget import Budget
 from api.models.container import Container, ContainerType
 from api.models.budget_post import BudgetPost, BudgetPostDirection
+from api.models.archived_budget_post import ArchivedBudgetPost
 from api.models.user import User
 from api.services.budget_post_service import (
     create_budget_post,
@@ -27,7 +28,6 @@ def test_user(db: Session) -> User:
     )
     db.add(user)
     db.commit()
-    db.refresh(user)
     return user
 
 
@@ -42,7 +42,6 @@ def test_budget(db: Session, test_user: User) -> Budget:
     )
     db.add(budget)
     db.commit()
-    db.refresh(budget)
     return budget
 
 
@@ -61,7 +60,6 @@ def cashbox_container(db: Session, test_budget: Budget, test_user: User) -> Cont
     )
     db.add(container)
     db.commit()
-    db.refresh(container)
     return container
 
 
@@ -305,61 +303,51 @@ class TestArchivedBudgetPostQueries:
         assert retrieved_archived is None
 
 
-class TestArchivedBudgetPostImmutability:
-    """Test that archived budget posts preserve snapshots."""
-
-    def test_archived_post_preserved_after_budget_post_update(
-        self, db: Session, test_budget: Budget, test_user: User, sample_budget_post: BudgetPost
-    ):
-        """Archived post is not affected by updates to the original budget post."""
-        # Create archived post
-        archived_post = create_archived_budget_post(
-            db=db,
-            budget_id=test_budget.id,
-            budget_post=sample_budget_post,
-            period_year=2026,
-            period_month=5,
-            user_id=test_user.id,
-        )
-
-        original_occurrences = len(archived_post.amount_occurrences)
-
-        # Update the original budget post (change category_path)
-        sample_budget_post.category_path = ["Udgift", "Transport"]
-        db.commit()
+@pytest.fixture
+def archived_for_mutation(
+    db: Session, test_budget: Budget, test_user: User, sample_budget_post: BudgetPost
+) -> ArchivedBudgetPost:
+    """Archive the sample budget post once, before the original is mutated."""
+    return create_archived_budget_post(
+        db=db,
+        budget_id=test_budget.id,
+        budget_post=sample_budget_post,
+        period_year=2026,
+        period_month=5,
+        user_id=test_user.id,
+    )
 
-        # Re-fetch archived post
-        db.refresh(archived_post)
 
-        # Archived post should be unchanged
-        assert archived_post.category_path == ["Udgift", "Husleje"]
-        assert len(archived_post.amount_occurrences) == original_occurrences
+class TestArchivedBudgetPostImmutability:
+    """Test that archived budget posts preserve snapshots."""
 
-    def test_archived_post_preserved_after_budget_post_deletion(
-        self, db: Session, test_budget: Budget, test_user: User, sample_budget_post: BudgetPost
+    @pytest.mark.parametrize("mutation", ["update", "soft_delete"])
+    def test_archived_post_preserved_after_budget_post_mutation(
+        self,
+        db: Session,
+        test_budget: Budget,
+        sample_budget_post: BudgetPost,
+        archived_for_mutation: ArchivedBudgetPost,
+        mutation: str,
     ):
-        """Archived post is preserved even if original budget post is deleted."""
-        from datetime import datetime, UTC
-
-        # Create archived post
-        archived_post = create_archived_budget_post(
-            db=db,
-            budget_id=test_budget.id,
-            budget_post=sample_budget_post,
-            period_year=2026,
-            period_month=6,
-            user_id=test_user.id,
-        )
-
-        archived_post_id = archived_post.id
-
-        # Soft delete the original budget post
-        sample_budget_post.deleted_at = datetime.now(UTC)
+        """Archived post is not affected by updates to or deletion of the original budget post."""
+        archived_post_id = archived_for_mutation.id
+        original_occurrences = len(archived_for_mutation.amount_occurrences)
+
+        if mutation == "update":
+            # Change category_path on the original budget post
+            sample_budget_post.category_path = ["Udgift", "Transport"]
+        else:
+            # Soft delete the original budget post
+            sample_budget_post.deleted_at = datetime.now(UTC)
         db.commit()
 
-        # Archived post should still exist
+        # Re-fetch archived post from the database, not the identity map
+        db.expire_all()
         retrieved = get_archived_budget_post_by_id(db=db, archived_post_id=archived_post_id, budget_id=test_budget.id)
 
+        # Archived post should still exist and be unchanged
         assert retrieved is not None
         assert retrieved.budget_post_id == sample_budget_post.id  # Reference preserved
-        assert len(retrieved.amount_occurrences) > 0
+        assert retrieved.category_path == ["Udgift", "Husleje"]
+        assert len(retrieved.amount_occurrences) == original_occurrences > 0
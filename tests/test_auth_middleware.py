@@ -1,28 +1,5 @@
 """Tests for authentication middleware."""
 
-import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy.orm import Session as DBSession
-
-from api.main import app
-from api.deps.database import get_db
-
-
-@pytest.fixture
-def client(db: DBSession):
-    """Create test client with overridden database dependency."""
-
-    def override_get_db():
-        try:
-            yield db
-        finally:
-            pass
-
-    app.dependency_overrides[get_db] = override_get_db
-    client = TestClient(app)
-    yield client
-    app.dependency_overrides.clear()
-
 
 class TestAuthMiddleware:
     """Tests for auth middleware (get_current_user dependency)."""
@@ -50,7 +27,7 @@ class TestAuthMiddleware:
 
         assert response.status_code == 401
 
-    def test_protected_route_with_valid_session(self, client, db):
+    def test_protected_route_with_valid_session(self, client, db, count_queries):
         """Protected route with valid session returns user data."""
         # Register to get a valid session
         register_response = client.post(
@@ -66,9 +43,12 @@ class TestAuthMiddleware:
         assert "session_id" in client.cookies
 
         # Access protected route - TestClient should maintain session
-        response = client.get("/api/auth/me")
+        with count_queries() as queries:
+            response = client.get("/api/auth/me")
 
         assert response.status_code == 200
+        # Session lookup, sliding-expiration UPDATE, user lookup
+        assert len(queries) <= 3
         data = response.json()
         assert data["email"] == "protected@example.com"
         assert "id" in data
@@ -12,28 +12,36 @@ from api.services.auth import (
 )
 
 
+# Edge-case passwords around the length limits
+_MIN_OK = "a" * MIN_PASSWORD_LENGTH
+_MAX_OK = "a" * MAX_PASSWORD_LENGTH
+_TOO_SHORT = "a" * (MIN_PASSWORD_LENGTH - 1)
+_TOO_LONG = "a" * (MAX_PASSWORD_LENGTH + 1)
+
+
 class TestPasswordValidation:
     """Tests for password validation."""
 
     def test_valid_password(self):
         """Valid password should not raise."""
-        validate_password("a" * MIN_PASSWORD_LENGTH)
-        validate_password("a" * MAX_PASSWORD_LENGTH)
+        validate_password(_MIN_OK)
+        validate_password(_MAX_OK)
         validate_password("SecurePassword123!")
 
     def test_password_too_short(self):
         """Password shorter than minimum should raise."""
         with pytest.raises(PasswordValidationError) as exc_info:
-            validate_password("a" * (MIN_PASSWORD_LENGTH - 1))
+            validate_password(_TOO_SHORT)
         assert f"at least {MIN_PASSWORD_LENGTH}" in str(exc_info.value)
 
     def test_password_too_long(self):
         """Password longer than maximum should raise."""
         with pytest.raises(PasswordValidationError) as exc_info:
-            validate_password("a" * (MAX_PASSWORD_LENGTH + 1))
+            validate_password(_TOO_LONG)
         assert f"at most {MAX_PASSWORD_LENGTH}" in str(exc_info.value)
 
 
+@pytest.mark.slow
 class TestPasswordHashing:
     """Tests for password hashing."""
 
@@ -62,21 +70,22 @@ class TestPasswordHashing:
             hash_password("short")
 
 
+@pytest.mark.slow
 class TestPasswordVerification:
-    """Tests for password verification."""
+    """Tests for password verification.
 
-    def test_verify_correct_password(self):
+    Uses the session-scoped hash of "SecurePassword123!" from conftest so the
+    class pays for a single bcrypt hash.
+    """
+
+    def test_verify_correct_password(self, _test_password_hash):
         """Correct password should verify."""
-        password = "SecurePassword123!"
-        hashed = hash_password(password)
-        assert verify_password(password, hashed) is True
+        assert verify_password("SecurePassword123!", _test_password_hash) is True
 
-    def test_verify_wrong_password(self):
+    def test_verify_wrong_password(self, _test_password_hash):
         """Wrong password should not verify."""
-        hashed = hash_password("SecurePassword123!")
-        assert verify_password("WrongPassword123!", hashed) is False
+        assert verify_password("WrongPassword123!", _test_password_hash) is False
 
-    def test_verify_similar_password(self):
+    def test_verify_similar_password(self, _test_password_hash):
         """Similar but different password should not verify."""
-        hashed = hash_password("SecurePassword123!")
-        assert verify_password("SecurePassword123", hashed) is False
+        assert verify_password("SecurePassword123", _test_password_hash) is False
@@ -14,32 +14,45 @@ from api.utils.bank_days import (
 )
 
 
+# Reference dates reused across the bank day tests
+TUE_FEB10 = date(2026, 2, 10)  # Regular bank day
+FRI_FEB13 = date(2026, 2, 13)
+SAT_FEB14 = date(2026, 2, 14)
+SUN_FEB15 = date(2026, 2, 15)
+MON_FEB16 = date(2026, 2, 16)
+SAT_JAN31 = date(2026, 1, 31)  # Last day of January
+SUN_MAR1 = date(2026, 3, 1)  # First day of March
+GRUNDLOVSDAG_2026 = date(2026, 6, 5)  # Friday holiday
+
+
 class TestEasterComputation:
     """Test Easter date computation using Anonymous Gregorian algorithm."""
 
-    def test_easter_2024(self):
-        """Easter 2024 is March 31."""
-        assert _compute_easter(2024) == date(2024, 3, 31)
+    @pytest.mark.parametrize(
+        "year,expected",
+        [
+            (2024, date(2024, 3, 31)),
+            (2025, date(2025, 4, 20)),
+            (2026, date(2026, 4, 5)),
+            (2027, date(2027, 3, 28)),
+        ],
+    )
+    def test_easter(self, year, expected):
+        """Easter Sunday matches the known date for the year."""
+        assert _compute_easter(year) == expected
 
-    def test_easter_2025(self):
-        """Easter 2025 is April 20."""
-        assert _compute_easter(2025) == date(2025, 4, 20)
 
-    def test_easter_2026(self):
-        """Easter 2026 is April 5."""
-        assert _compute_easter(2026) == date(2026, 4, 5)
-
-    def test_easter_2027(self):
-        """Easter 2027 is March 28."""
-        assert _compute_easter(2027) == date(2027, 3, 28)
+@pytest.fixture(scope="module")
+def calendar() -> DanishHolidayCalendar:
+    """Danish holiday calendar shared by the module."""
+    return DanishHolidayCalendar()
 
 
 class TestDanishHolidays:
     """Test Danish holiday calendar."""
 
-    def test_danish_holidays_2026(self):
+    def test_danish_holidays_2026(self, calendar):
         """Test all 11 Danish public holidays in 2026."""
-        calendar = DanishHolidayCalendar()
         holidays = calendar.get_holidays(2026)
 
         # Easter 2026 is April 5
@@ -60,10 +73,8 @@ class TestDanishHolidays:
         assert holidays == expected
         assert len(holidays) == 11
 
-    def test_danish_holidays_different_years(self):
+    def test_danish_holidays_different_years(self, calendar):
         """Holidays change based on Easter date across years."""
-        calendar = DanishHolidayCalendar()
-
         holidays_2024 = calendar.get_holidays(2024)
         holidays_2025 = calendar.get_holidays(2025)
 
@@ -83,22 +94,22 @@ class TestIsBankDay:
     def test_weekday_non_holiday(self):
         """Regular weekday that's not a holiday is a bank day."""
         # Feb 10, 2026 is a Tuesday, not a holiday
-        assert is_bank_day(date(2026, 2, 10)) is True
+        assert is_bank_day(TUE_FEB10) is True
 
     def test_saturday_not_bank_day(self):
         """Saturday is not a bank day."""
         # Feb 14, 2026 is a Saturday
-        assert is_bank_day(date(2026, 2, 14)) is False
+        assert is_bank_day(SAT_FEB14) is False
 
     def test_sunday_not_bank_day(self):
         """Sunday is not a bank day."""
         # Feb 15, 2026 is a Sunday
-        assert is_bank_day(date(2026, 2, 15)) is False
+        assert is_bank_day(SUN_FEB15) is False
 
     def test_holiday_not_bank_day(self):
         """Holiday is not a bank day, even on weekday."""
         # June 5, 2026 is Grundlovsdag (Friday)
-        assert is_bank_day(date(2026, 6, 5)) is False
+        assert is_bank_day(GRUNDLOVSDAG_2026) is False
 
     def test_christmas_not_bank_day(self):
         """Christmas Day is not a bank day."""
@@ -115,23 +126,23 @@ class TestNextBankDay:
     def test_already_bank_day(self):
         """If already a bank day, return same date."""
         # Feb 10, 2026 is a Tuesday, not a holiday
-        d = date(2026, 2, 10)
+        d = TUE_FEB10
         assert next_bank_day(d) == d
 
     def test_saturday_to_monday(self):
         """Saturday advances to Monday."""
         # Feb 14, 2026 is Saturday -> Feb 16, 2026 is Monday
-        assert next_bank_day(date(2026, 2, 14)) == date(2026, 2, 16)
+        assert next_bank_day(SAT_FEB14) == MON_FEB16
 
     def test_sunday_to_monday(self):
         """Sunday advances to Monday."""
         # Feb 15, 2026 is Sunday -> Feb 16, 2026 is Monday
-        assert next_bank_day(date(2026, 2, 15)) == date(2026, 2, 16)
+        assert next_bank_day(SUN_FEB15) == MON_FEB16
 
     def test_holiday_to_next_bank_day(self):
         """Holiday advances to next bank day."""
         # June 5, 2026 is Grundlovsdag (Friday) -> June 8 (Monday)
-        assert next_bank_day(date(2026, 6, 5)) == date(2026, 6, 8)
+        assert next_bank_day(GRUNDLOVSDAG_2026) == date(2026, 6, 8)
 
     def test_holiday_chain_easter(self):
         """Multiple holidays in a row (Easter weekend)."""
@@ -148,23 +159,23 @@ class TestPreviousBankDay:
     def test_already_bank_day(self):
         """If already a bank day, return same date."""
         # Feb 10, 2026 is a Tuesday, not a holiday
-        d = date(2026, 2, 10)
+        d = TUE_FEB10
         assert previous_bank_day(d) == d
 
     def test_saturday_to_friday(self):
         """Saturday goes back to Friday."""
         # Feb 14, 2026 is Saturday -> Feb 13, 2026 is Friday
-        assert previous_bank_day(date(2026, 2, 14)) == date(2026, 2, 13)
+        assert previous_bank_day(SAT_FEB14) == FRI_FEB13
 
     def test_sunday_to_friday(self):
         """Sunday goes back to Friday."""
         # Feb 15, 2026 is Sunday -> Feb 13, 2026 is Friday
-        assert previous_bank_day(date(2026, 2, 15)) == date(2026, 2, 13)
+        assert previous_bank_day(SUN_FEB15) == FRI_FEB13
 
     def test_holiday_to_previous_bank_day(self):
         """Holiday goes back to previous bank day."""
         # June 5, 2026 is Grundlovsdag (Friday) -> June 4 (Thursday)
-        assert previous_bank_day(date(2026, 6, 5)) == date(2026, 6, 4)
+        assert previous_bank_day(GRUNDLOVSDAG_2026) == date(2026, 6, 4)
 
     def test_holiday_chain_easter(self):
         """Multiple holidays in a row (Easter weekend)."""
@@ -182,42 +193,42 @@ class TestAdjustToBankDay:
     def test_none_adjustment(self):
         """Direction 'none' returns original date."""
         # Feb 14, 2026 is Saturday
-        d = date(2026, 2, 14)
+        d = SAT_FEB14
         assert adjust_to_bank_day(d, "none") == d
 
     def test_already_bank_day_next(self):
         """Already a bank day, return same with 'next'."""
-        d = date(2026, 2, 10)  # Tuesday
+        d = TUE_FEB10  # Tuesday
         assert adjust_to_bank_day(d, "next") == d
 
     def test_already_bank_day_previous(self):
         """Already a bank day, return same with 'previous'."""
-        d = date(2026, 2, 10)  # Tuesday
+        d = TUE_FEB10  # Tuesday
         assert adjust_to_bank_day(d, "previous") == d
 
     def test_saturday_next_same_month(self):
         """Saturday with 'next' stays in same month."""
         # Feb 14, 2026 is Saturday -> Feb 16 (Monday), same month
-        assert adjust_to_bank_day(date(2026, 2, 14), "next") == date(2026, 2, 16)
+        assert adjust_to_bank_day(SAT_FEB14, "next") == MON_FEB16
 
     def test_saturday_previous_same_month(self):
         """Saturday with 'previous' stays in same month."""
         # Feb 14, 2026 is Saturday -> Feb 13 (Friday), same month
-        assert adjust_to_bank_day(date(2026, 2, 14), "previous") == date(2026, 2, 13)
+        assert adjust_to_bank_day(SAT_FEB14, "previous") == FRI_FEB13
 
     def test_month_boundary_next_clamps_to_previous(self):
         """If 'next' would cross month boundary, use 'previous' instead."""
         # Jan 31, 2026 is Saturday
         # Next bank day would be Feb 2 (Monday) - crosses boundary
         # So it should use previous instead -> Jan 30 (Friday)
-        assert adjust_to_bank_day(date(2026, 1, 31), "next") == date(2026, 1, 30)
+        assert adjust_to_bank_day(SAT_JAN31, "next") == date(2026, 1, 30)
 
     def test_month_boundary_previous_clamps_to_next(self):
         """If 'previous' would cross month boundary, use 'next' instead."""
         # March 1, 2026 is Sunday
         # Previous bank day would be Feb 27 (Friday) - crosses boundary
         # So it should use next instead -> March 2 (Monday)
-        assert adjust_to_bank_day(date(2026, 3, 1), "previous") == date(2026, 3, 2)
+        assert adjust_to_bank_day(SUN_MAR1, "previous") == date(2026, 3, 2)
 
     def test_weekday_within_month(self):
         """Normal weekday adjustment stays within month."""
@@ -231,23 +242,23 @@ class TestAdjustToBankDay:
         # Jan 31, 2026 is Saturday
         # Next bank day is Feb 2 (Monday) - crosses boundary
         # With keep_in_month=False, should return Feb 2
-        assert adjust_to_bank_day(date(2026, 1, 31), "next", keep_in_month=False) == date(2026, 2, 2)
+        assert adjust_to_bank_day(SAT_JAN31, "next", keep_in_month=False) == date(2026, 2, 2)
 
     def test_previous_crosses_month_when_allowed(self):
         """When keep_in_month=False, 'previous' can cross month boundary."""
         # March 1, 2026 is Sunday
         # Previous bank day is Feb 27 (Friday) - crosses boundary
         # With keep_in_month=False, should return Feb 27
-        assert adjust_to_bank_day(date(2026, 3, 1), "previous", keep_in_month=False) == date(2026, 2, 27)
+        assert adjust_to_bank_day(SUN_MAR1, "previous", keep_in_month=False) == date(2026, 2, 27)
 
     def test_keep_in_month_true_is_default(self):
         """Default behavior (no keep_in_month param) should clamp to same month."""
         # Same as existing test_month_boundary_next_clamps_to_previous
-        assert adjust_to_bank_day(date(2026, 1, 31), "next") == date(2026, 1, 30)
+        assert adjust_to_bank_day(SAT_JAN31, "next") == date(2026, 1, 30)
 
     def test_none_direction_ignores_keep_in_month(self):
         """Direction 'none' always returns original regardless of keep_in_month."""
-        d = date(2026, 1, 31)
+        d = SAT_JAN31
         assert adjust_to_bank_day(d, "none", keep_in_month=False) == d
 
 
@@ -257,22 +268,22 @@ class TestUnsupportedCountry:
     def test_unknown_country_raises_error(self):
         """Unknown country code should raise KeyError."""
         with pytest.raises(KeyError, match="Unsupported country code: XX"):
-            is_bank_day(date(2026, 2, 10), country="XX")
+            is_bank_day(TUE_FEB10, country="XX")
 
     def test_unknown_country_next_bank_day(self):
         """Unknown country code in next_bank_day should raise KeyError."""
         with pytest.raises(KeyError, match="Unsupported country code: XX"):
-            next_bank_day(date(2026, 2, 10), country="XX")
+            next_bank_day(TUE_FEB10, country="XX")
 
     def test_unknown_country_previous_bank_day(self):
         """Unknown country code in previous_bank_day should raise KeyError."""
         with pytest.raises(KeyError, match="Unsupported country code: XX"):
-            previous_bank_day(date(2026, 2, 10), country="XX")
+            previous_bank_day(TUE_FEB10, country="XX")
 
     def test_unknown_country_adjust_to_bank_day(self):
         """Unknown country code in adjust_to_bank_day should raise KeyError."""
         with pytest.raises(KeyError, match="Unsupported country code: XX"):
-            adjust_to_bank_day(date(2026, 2, 10), "next", country="XX")
+            adjust_to_bank_day(TUE_FEB10, "next", country="XX")
 
 
 class TestNthBankDayInMonth:
@@ -310,7 +321,7 @@ class TestNthBankDayInMonth:
         # Feb 2 Mon (1st), Feb 3 Tue (2nd), Feb 4 Wed (3rd), Feb 5 Thu (4th), Feb 6 Fri (5th)
         # Feb 7 Sat, Feb 8 Sun
         # Feb 9 Mon (6th), Feb 10 Tue (7th), Feb 11 Wed (8th), Feb 12 Thu (9th), Feb 13 Fri (10th)
-        assert nth_bank_day_in_month(2026, 2, 10, from_end=False) == date(2026, 2, 13)
+        assert nth_bank_day_in_month(2026, 2, 10, from_end=False) == FRI_FEB13
 
     def test_month_with_holidays(self):
         """First bank day of April 2026 (month with Easter holidays)."""
@@ -1,214 +1,208 @@
 """Simplified tests for budget post hierarchy validation and cascade."""
 
+import uuid
+from types import SimpleNamespace
+
 import pytest
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
 from api.models.budget import Budget
 from api.models.container import Container, ContainerType
-from api.models.budget_post import BudgetPostDirection
+from api.models.budget_post import BudgetPost, BudgetPostDirection
 from api.models.user import User
 from api.services.budget_post_service import (
+    ANCESTOR_POOL_SUBSET_ERROR,
     create_budget_post,
     update_budget_post,
     BudgetPostValidationError,
 )
 
 
-@pytest.fixture
-def test_user(db: Session) -> User:
-    user = User(email="hierarchy_simple@example.com", password_hash="dummy_hash")
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    return user
+_CONTAINER_SEEDS = {
+    "cashbox1": ("Cashbox 1", ContainerType.CASHBOX, 100000),
+    "cashbox2": ("Cashbox 2", ContainerType.CASHBOX, 50000),
+    "cashbox3": ("Cashbox 3", ContainerType.CASHBOX, 25000),
+    "piggybank": ("Piggybank X", ContainerType.PIGGYBANK, 0),
+    "piggybank_y": ("Piggybank Y", ContainerType.PIGGYBANK, 0),
+}
 
 
-@pytest.fixture
-def test_budget(db: Session, test_user: User) -> Budget:
-    budget = Budget(
-        name="Hierarchy Test Budget",
-        owner_id=test_user.id,
-        created_by=test_user.id,
-        updated_by=test_user.id,
-    )
-    db.add(budget)
-    db.commit()
-    db.refresh(budget)
-    return budget
-
+def _patterns(amount: int) -> list[dict]:
+    """A single open-ended amount pattern starting 2026-01-01."""
+    return [{"amount": amount, "start_date": "2026-01-01", "end_date": None}]
 
-@pytest.fixture
-def cashbox1(db: Session, test_budget: Budget, test_user: User) -> Container:
-    container = Container(
-        budget_id=test_budget.id,
-        name="Cashbox 1",
-        type=ContainerType.CASHBOX,
-        starting_balance=100000,
-        created_by=test_user.id,
-        updated_by=test_user.id,
-    )
-    db.add(container)
-    db.commit()
-    db.refresh(container)
-    return container
 
+def _add_expense_posts(
+    db: Session, budget: Budget, user: User, pools: dict[tuple[str, ...], list[str]]
+) -> list[BudgetPost]:
+    """
+    Insert expense posts (category path -> container pool) in one flush.
 
-@pytest.fixture
-def cashbox2(db: Session, test_budget: Budget, test_user: User) -> Container:
-    container = Container(
-        budget_id=test_budget.id,
-        name="Cashbox 2",
-        type=ContainerType.CASHBOX,
-        starting_balance=50000,
-        created_by=test_user.id,
-        updated_by=test_user.id,
-    )
-    db.add(container)
+    Setup shortcut for cascade tests: skips create_budget_post and its
+    validation, so callers must pass pools that already satisfy the hierarchy.
+    """
+    posts = [
+        BudgetPost(
+            budget_id=budget.id,
+            direction=BudgetPostDirection.EXPENSE,
+            category_path=list(path),
+            container_ids=container_ids,
+            created_by=user.id,
+            updated_by=user.id,
+        )
+        for path, container_ids in pools.items()
+    ]
+    db.add_all(posts)
     db.commit()
-    db.refresh(container)
-    return container
+    return posts
+
+
+_SEED_EMAIL = "hierarchy_simple@example.com"
+
+
+def _delete_seed(session: Session) -> None:
+    """Delete the seeded user and its budgets (containers go with the budget via ON DELETE CASCADE)."""
+    user_ids = select(User.id).where(User.email == _SEED_EMAIL).scalar_subquery()
+    session.execute(delete(Budget).where(Budget.owner_id.in_(user_ids)))
+    session.execute(delete(User).where(User.email == _SEED_EMAIL))
+    session.commit()
+
+
+@pytest.fixture(scope="module")
+def _hierarchy_seed(engine, tables) -> dict[str, uuid.UUID]:
+    """
+    Commit the user, budget and containers shared by this module once.
+
+    Tests only add budget posts, which the per-test rollback discards, so the
+    seeded rows stay unchanged. They are deleted again at module teardown;
+    rows left behind by an interrupted earlier run are cleared before seeding.
+    """
+    with Session(engine) as session:
+        _delete_seed(session)
+        user = User(email=_SEED_EMAIL, password_hash="dummy_hash")
+        session.add(user)
+        session.flush()
+        budget = Budget(
+            name="Hierarchy Test Budget",
+            owner_id=user.id,
+            created_by=user.id,
+            updated_by=user.id,
+        )
+        session.add(budget)
+        session.flush()
+        containers = {
+            key: Container(
+                budget_id=budget.id,
+                name=name,
+                type=container_type,
+                starting_balance=starting_balance,
+                created_by=user.id,
+                updated_by=user.id,
+            )
+            for key, (name, container_type, starting_balance) in _CONTAINER_SEEDS.items()
+        }
+        session.add_all(containers.values())
+        session.flush()
+        ids = {"user": user.id, "budget": budget.id} | {key: c.id for key, c in containers.items()}
+        session.commit()
+
+    try:
+        yield ids
+    finally:
+        with Session(engine) as session:
+            _delete_seed(session)
 
 
 @pytest.fixture
-def cashbox3(db: Session, test_budget: Budget, test_user: User) -> Container:
-    container = Container(
-        budget_id=test_budget.id,
-        name="Cashbox 3",
-        type=ContainerType.CASHBOX,
-        starting_balance=25000,
-        created_by=test_user.id,
-        updated_by=test_user.id,
-    )
-    db.add(container)
-    db.commit()
-    db.refresh(container)
-    return container
+def test_user(db: Session, _hierarchy_seed) -> User:
+    return db.get(User, _hierarchy_seed["user"])
 
 
 @pytest.fixture
-def piggybank(db: Session, test_budget: Budget, test_user: User) -> Container:
-    container = Container(
-        budget_id=test_budget.id,
-        name="Piggybank X",
-        type=ContainerType.PIGGYBANK,
-        starting_balance=0,
-        created_by=test_user.id,
-        updated_by=test_user.id,
-    )
-    db.add(container)
-    db.commit()
-    db.refresh(container)
-    return container
+def test_budget(db: Session, _hierarchy_seed) -> Budget:
+    return db.get(Budget, _hierarchy_seed["budget"])
 
 
-@pytest.fixture
-def piggybank_y(db: Session, test_budget: Budget, test_user: User) -> Container:
-    container = Container(
-        budget_id=test_budget.id,
-        name="Piggybank Y",
-        type=ContainerType.PIGGYBANK,
-        starting_balance=0,
-        created_by=test_user.id,
-        updated_by=test_user.id,
-    )
-    db.add(container)
-    db.commit()
-    db.refresh(container)
-    return container
+@pytest.fixture(scope="module")
+def containers(_hierarchy_seed) -> SimpleNamespace:
+    """The seeded container ids as strings (the form the service takes), e.g. containers.cashbox1."""
+    return SimpleNamespace(**{key: str(_hierarchy_seed[key]) for key in _CONTAINER_SEEDS})
 
 
-def test_create_child_with_valid_subset(
-    db: Session,
-    test_budget: Budget,
-    test_user: User,
-    cashbox1: Container,
-    cashbox2: Container,
-    cashbox3: Container,
-):
-    """Child with subset of ancestor containers succeeds."""
-    # Parent with all three
-    parent, _ = create_budget_post(
+@pytest.fixture
+def food_parent(db: Session, test_budget: Budget, test_user: User, containers: SimpleNamespace) -> BudgetPost:
+    """Root expense post ["Food"] over all three cashboxes."""
+    post, _ = create_budget_post(
         db=db,
         budget_id=test_budget.id,
         user_id=test_user.id,
         direction=BudgetPostDirection.EXPENSE,
         category_path=["Food"],
-        container_ids=[str(cashbox1.id), str(cashbox2.id), str(cashbox3.id)],
-        amount_patterns=[{
-            "amount": 100000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
+        container_ids=[containers.cashbox1, containers.cashbox2, containers.cashbox3],
+        amount_patterns=_patterns(100000),
     )
-    assert parent is not None
-
-    # Child with subset
-    child, _ = create_budget_post(
-        db=db,
-        budget_id=test_budget.id,
-        user_id=test_user.id,
-        direction=BudgetPostDirection.EXPENSE,
-        category_path=["Food", "Groceries"],
-        container_ids=[str(cashbox1.id), str(cashbox2.id)],
-        amount_patterns=[{
-            "amount": 50000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
-    )
-    assert child is not None
-    assert set(child.container_ids) == {str(cashbox1.id), str(cashbox2.id)}
+    return post
 
 
-def test_create_child_with_superset_rejected(
+@pytest.mark.parametrize(
+    "parent_keys,child_keys,allowed",
+    [
+        (("cashbox1", "cashbox2", "cashbox3"), ("cashbox1", "cashbox2"), True),
+        (("cashbox1", "cashbox2"), ("cashbox1", "cashbox2", "cashbox3"), False),
+    ],
+    ids=["valid_subset", "superset_rejected"],
+)
+def test_create_child_subset_validation(
     db: Session,
     test_budget: Budget,
     test_user: User,
-    cashbox1: Container,
-    cashbox2: Container,
-    cashbox3: Container,
+    containers: SimpleNamespace,
+    parent_keys: tuple[str, ...],
+    child_keys: tuple[str, ...],
+    allowed: bool,
 ):
-    """Child with superset of ancestor containers is rejected."""
-    # Parent with only two
+    """Child must use a subset of its ancestor's containers; a superset is rejected."""
+    parent_ids = [getattr(containers, key) for key in parent_keys]
+    child_ids = [getattr(containers, key) for key in child_keys]
+
     parent, _ = create_budget_post(
         db=db,
         budget_id=test_budget.id,
         user_id=test_user.id,
         direction=BudgetPostDirection.EXPENSE,
         category_path=["Food"],
-        container_ids=[str(cashbox1.id), str(cashbox2.id)],
-        amount_patterns=[{
-            "amount": 100000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
+        container_ids=parent_ids,
+        amount_patterns=_patterns(100000),
     )
+    assert parent is not None
 
-    # Try child with all three (superset)
-    with pytest.raises(BudgetPostValidationError) as exc_info:
-        create_budget_post(
+    def create_child():
+        return create_budget_post(
             db=db,
             budget_id=test_budget.id,
             user_id=test_user.id,
             direction=BudgetPostDirection.EXPENSE,
             category_path=["Food", "Groceries"],
-            container_ids=[str(cashbox1.id), str(cashbox2.id), str(cashbox3.id)],
-            amount_patterns=[{
-                "amount": 50000,
-                "start_date": "2026-01-01",
-                "end_date": None,
-            }],
+            container_ids=child_ids,
+            amount_patterns=_patterns(50000),
         )
-    assert "must be a subset of ancestor" in exc_info.value.message
+
+    if allowed:
+        child, _ = create_child()
+        assert child is not None
+        assert child.container_ids == child_ids
+    else:
+        with pytest.raises(BudgetPostValidationError) as exc_info:
+            create_child()
+        assert exc_info.value.message == ANCESTOR_POOL_SUBSET_ERROR
 
 
 def test_create_parent_over_children_cascades(
     db: Session,
     test_budget: Budget,
     test_user: User,
-    cashbox1: Container,
-    cashbox2: Container,
-    cashbox3: Container,
+    containers: SimpleNamespace,
 ):
     """Creating parent over existing children cascades the narrowing."""
     # Children first with all three
@@ -218,12 +212,8 @@ def test_create_parent_over_children_cascades(
         user_id=test_user.id,
         direction=BudgetPostDirection.EXPENSE,
         category_path=["Food", "Groceries"],
-        container_ids=[str(cashbox1.id), str(cashbox2.id), str(cashbox3.id)],
-        amount_patterns=[{
-            "amount": 50000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
+        container_ids=[containers.cashbox1, containers.cashbox2, containers.cashbox3],
+        amount_patterns=_patterns(50000),
     )
 
     # Parent with subset
@@ -233,12 +223,8 @@ def test_create_parent_over_children_cascades(
         user_id=test_user.id,
         direction=BudgetPostDirection.EXPENSE,
         category_path=["Food"],
-        container_ids=[str(cashbox1.id), str(cashbox2.id)],
-        amount_patterns=[{
-            "amount": 100000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
+        container_ids=[containers.cashbox1, containers.cashbox2],
+        amount_patterns=_patterns(100000),
     )
 
     # Child should be cascaded
@@ -246,33 +232,17 @@ def test_create_parent_over_children_cascades(
     assert str(child1.id) in [a["post_id"] for a in affected]
 
     db.refresh(child1)
-    assert set(child1.container_ids) == {str(cashbox1.id), str(cashbox2.id)}
+    assert child1.container_ids == [containers.cashbox1, containers.cashbox2]
 
 
 def test_update_parent_cascades_to_descendants(
     db: Session,
     test_budget: Budget,
     test_user: User,
-    cashbox1: Container,
-    cashbox2: Container,
-    cashbox3: Container,
+    containers: SimpleNamespace,
+    food_parent: BudgetPost,
 ):
     """Updating parent to narrow pool cascades to descendants."""
-    # Parent with all three
-    parent, _ = create_budget_post(
-        db=db,
-        budget_id=test_budget.id,
-        user_id=test_user.id,
-        direction=BudgetPostDirection.EXPENSE,
-        category_path=["Food"],
-        container_ids=[str(cashbox1.id), str(cashbox2.id), str(cashbox3.id)],
-        amount_patterns=[{
-            "amount": 100000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
-    )
-
     # Child with all three
     child, _ = create_budget_post(
         db=db,
@@ -280,21 +250,17 @@ def test_update_parent_cascades_to_descendants(
         user_id=test_user.id,
         direction=BudgetPostDirection.EXPENSE,
         category_path=["Food", "Groceries"],
-        container_ids=[str(cashbox1.id), str(cashbox2.id), str(cashbox3.id)],
-        amount_patterns=[{
-            "amount": 50000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
+        container_ids=[containers.cashbox1, containers.cashbox2, containers.cashbox3],
+        amount_patterns=_patterns(50000),
     )
 
     # Update parent to only cashbox1
     _, affected = update_budget_post(
         db=db,
-        post_id=parent.id,
+        post_id=food_parent.id,
         budget_id=test_budget.id,
         user_id=test_user.id,
-        container_ids=[str(cashbox1.id)],
+        container_ids=[containers.cashbox1],
     )
 
     # Child should be cascaded
@@ -302,69 +268,36 @@ def test_update_parent_cascades_to_descendants(
     assert affected[0]["post_id"] == str(child.id)
 
     db.refresh(child)
-    assert child.container_ids == [str(cashbox1.id)]
+    assert child.container_ids == [containers.cashbox1]
 
 
 def test_multi_level_cascade(
     db: Session,
     test_budget: Budget,
     test_user: User,
-    cashbox1: Container,
-    cashbox2: Container,
-    cashbox3: Container,
+    containers: SimpleNamespace,
+    food_parent: BudgetPost,
+    count_queries,
 ):
     """Cascade affects grandchildren too."""
-    # Hierarchy: Food -> Groceries -> Vegetables
-    parent, _ = create_budget_post(
-        db=db,
-        budget_id=test_budget.id,
-        user_id=test_user.id,
-        direction=BudgetPostDirection.EXPENSE,
-        category_path=["Food"],
-        container_ids=[str(cashbox1.id), str(cashbox2.id), str(cashbox3.id)],
-        amount_patterns=[{
-            "amount": 100000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
-    )
-
-    child, _ = create_budget_post(
-        db=db,
-        budget_id=test_budget.id,
-        user_id=test_user.id,
-        direction=BudgetPostDirection.EXPENSE,
-        category_path=["Food", "Groceries"],
-        container_ids=[str(cashbox1.id), str(cashbox2.id), str(cashbox3.id)],
-        amount_patterns=[{
-            "amount": 50000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
-    )
-
-    grandchild, _ = create_budget_post(
-        db=db,
-        budget_id=test_budget.id,
-        user_id=test_user.id,
-        direction=BudgetPostDirection.EXPENSE,
-        category_path=["Food", "Groceries", "Vegetables"],
-        container_ids=[str(cashbox1.id), str(cashbox2.id), str(cashbox3.id)],
-        amount_patterns=[{
-            "amount": 25000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
-    )
+    # Hierarchy: Food (food_parent) -> Groceries -> Vegetables
+    child, grandchild = _add_expense_posts(db, test_budget, test_user, {
+        ("Food", "Groceries"): [containers.cashbox1, containers.cashbox2, containers.cashbox3],
+        ("Food", "Groceries", "Vegetables"): [containers.cashbox1, containers.cashbox2, containers.cashbox3],
+    })
 
     # Update parent to only cashbox1
-    _, affected = update_budget_post(
-        db=db,
-        post_id=parent.id,
-        budget_id=test_budget.id,
-        user_id=test_user.id,
-        container_ids=[str(cashbox1.id)],
-    )
+    with count_queries() as queries:
+        _, affected = update_budget_post(
+            db=db,
+            post_id=food_parent.id,
+            budget_id=test_budget.id,
+            user_id=test_user.id,
+            container_ids=[containers.cashbox1],
+        )
+    # Post + patterns, container pool, descendants, one batched UPDATE for both
+    # descendants and the refresh; a per-descendant load would add to this.
+    assert len(queries) <= 6
 
     # Both child and grandchild should be affected
     assert len(affected) == 2
@@ -374,17 +307,15 @@ def test_multi_level_cascade(
 
     db.refresh(child)
     db.refresh(grandchild)
-    assert child.container_ids == [str(cashbox1.id)]
-    assert grandchild.container_ids == [str(cashbox1.id)]
+    assert child.container_ids == [containers.cashbox1]
+    assert grandchild.container_ids == [containers.cashbox1]
 
 
 def test_skip_level_ancestor_validation(
     db: Session,
     test_budget: Budget,
     test_user: User,
-    cashbox1: Container,
-    cashbox2: Container,
-    cashbox3: Container,
+    containers: SimpleNamespace,
 ):
     """C at ['A','B','C'], no B, but A exists -> C constrained by A."""
     # Parent at ["Food"] with cashbox1, cashbox2
@@ -394,12 +325,8 @@ def test_skip_level_ancestor_validation(
         user_id=test_user.id,
         direction=BudgetPostDirection.EXPENSE,
         category_path=["Food"],
-        container_ids=[str(cashbox1.id), str(cashbox2.id)],
-        amount_patterns=[{
-            "amount": 100000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
+        container_ids=[containers.cashbox1, containers.cashbox2],
+        amount_patterns=_patterns(100000),
     )
 
     # Grandchild (no intermediate) should be constrained by parent
@@ -409,12 +336,8 @@ def test_skip_level_ancestor_validation(
         user_id=test_user.id,
         direction=BudgetPostDirection.EXPENSE,
         category_path=["Food", "Groceries", "Vegetables"],
-        container_ids=[str(cashbox1.id), str(cashbox2.id)],
-        amount_patterns=[{
-            "amount": 25000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
+        container_ids=[containers.cashbox1, containers.cashbox2],
+        amount_patterns=_patterns(25000),
     )
     assert grandchild is not None
 
@@ -425,72 +348,33 @@ def test_skip_level_ancestor_validation(
             post_id=grandchild.id,
             budget_id=test_budget.id,
             user_id=test_user.id,
-            container_ids=[str(cashbox1.id), str(cashbox2.id), str(cashbox3.id)],
+            container_ids=[containers.cashbox1, containers.cashbox2, containers.cashbox3],
         )
-    assert "must be a subset of ancestor" in exc_info.value.message
+    assert exc_info.value.message == ANCESTOR_POOL_SUBSET_ERROR
 
 
 def test_cascade_with_intermediate_posts(
     db: Session,
     test_budget: Budget,
     test_user: User,
-    cashbox1: Container,
-    cashbox2: Container,
-    cashbox3: Container,
+    containers: SimpleNamespace,
+    food_parent: BudgetPost,
 ):
     """A->B->C all exist, A narrows -> B narrowed first, then C against B's new pool."""
-    # Create A with all three
-    a, _ = create_budget_post(
-        db=db,
-        budget_id=test_budget.id,
-        user_id=test_user.id,
-        direction=BudgetPostDirection.EXPENSE,
-        category_path=["Food"],
-        container_ids=[str(cashbox1.id), str(cashbox2.id), str(cashbox3.id)],
-        amount_patterns=[{
-            "amount": 100000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
-    )
-
-    # Create B with cashbox2 and cashbox3
-    b, _ = create_budget_post(
-        db=db,
-        budget_id=test_budget.id,
-        user_id=test_user.id,
-        direction=BudgetPostDirection.EXPENSE,
-        category_path=["Food", "Groceries"],
-        container_ids=[str(cashbox2.id), str(cashbox3.id)],
-        amount_patterns=[{
-            "amount": 50000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
-    )
-
-    # Create C with cashbox3
-    c, _ = create_budget_post(
-        db=db,
-        budget_id=test_budget.id,
-        user_id=test_user.id,
-        direction=BudgetPostDirection.EXPENSE,
-        category_path=["Food", "Groceries", "Vegetables"],
-        container_ids=[str(cashbox3.id)],
-        amount_patterns=[{
-            "amount": 25000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
-    )
+    # A is food_parent, with all three
+    # B with cashbox2 and cashbox3, C with cashbox3
+    b, c = _add_expense_posts(db, test_budget, test_user, {
+        ("Food", "Groceries"): [containers.cashbox2, containers.cashbox3],
+        ("Food", "Groceries", "Vegetables"): [containers.cashbox3],
+    })
 
     # Update A to only cashbox1 and cashbox2
     _, affected = update_budget_post(
         db=db,
-        post_id=a.id,
+        post_id=food_parent.id,
         budget_id=test_budget.id,
         user_id=test_user.id,
-        container_ids=[str(cashbox1.id), str(cashbox2.id)],
+        container_ids=[containers.cashbox1, containers.cashbox2],
     )
 
     # B should be narrowed to cashbox2 (intersection)
@@ -499,17 +383,16 @@ def test_cascade_with_intermediate_posts(
 
     db.refresh(b)
     db.refresh(c)
-    assert set(b.container_ids) == {str(cashbox2.id)}
+    assert b.container_ids == [containers.cashbox2]
     # C's intersection is empty, so gets B's full new pool
-    assert c.container_ids == [str(cashbox2.id)]
+    assert c.container_ids == [containers.cashbox2]
 
 
 def test_piggybank_inheritance(
     db: Session,
     test_budget: Budget,
     test_user: User,
-    piggybank: Container,
-    piggybank_y: Container,
+    containers: SimpleNamespace,
 ):
     """Create ancestor with piggybank X, create child - must use same piggybank. Try different piggybank -> rejected."""
     # Ancestor with piggybank X
@@ -519,12 +402,8 @@ def test_piggybank_inheritance(
         user_id=test_user.id,
         direction=BudgetPostDirection.EXPENSE,
         category_path=["Savings"],
-        container_ids=[str(piggybank.id)],
-        amount_patterns=[{
-            "amount": 100000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
+        container_ids=[containers.piggybank],
+        amount_patterns=_patterns(100000),
     )
     assert ancestor is not None
 
@@ -535,15 +414,11 @@ def test_piggybank_inheritance(
         user_id=test_user.id,
         direction=BudgetPostDirection.EXPENSE,
         category_path=["Savings", "Emergency Fund"],
-        container_ids=[str(piggybank.id)],
-        amount_patterns=[{
-            "amount": 50000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
+        container_ids=[containers.piggybank],
+        amount_patterns=_patterns(50000),
     )
     assert child is not None
-    assert child.container_ids == [str(piggybank.id)]
+    assert child.container_ids == [containers.piggybank]
 
     # Try child with different piggybank - should be rejected
     with pytest.raises(BudgetPostValidationError) as exc_info:
@@ -553,110 +428,57 @@ def test_piggybank_inheritance(
             user_id=test_user.id,
             direction=BudgetPostDirection.EXPENSE,
             category_path=["Savings", "Vacation Fund"],
-            container_ids=[str(piggybank_y.id)],
-            amount_patterns=[{
-                "amount": 30000,
-                "start_date": "2026-01-01",
-                "end_date": None,
-            }],
+            container_ids=[containers.piggybank_y],
+            amount_patterns=_patterns(30000),
         )
-    assert "must be a subset of ancestor" in exc_info.value.message
-
-
-def test_root_level_no_ancestor_constraint(
-    db: Session,
-    test_budget: Budget,
-    test_user: User,
-    cashbox1: Container,
-    cashbox2: Container,
-):
-    """Root-level post (category_path length 1, e.g. ['Food']) has no ancestor constraint and can use any containers."""
-    # Create root-level post with cashbox1
-    root1, _ = create_budget_post(
-        db=db,
-        budget_id=test_budget.id,
-        user_id=test_user.id,
-        direction=BudgetPostDirection.EXPENSE,
-        category_path=["Food"],
-        container_ids=[str(cashbox1.id)],
-        amount_patterns=[{
-            "amount": 100000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
-    )
-    assert root1 is not None
-    assert root1.container_ids == [str(cashbox1.id)]
-
-    # Create another root-level post with cashbox2 - should succeed (no ancestor constraint)
-    root2, _ = create_budget_post(
-        db=db,
-        budget_id=test_budget.id,
-        user_id=test_user.id,
-        direction=BudgetPostDirection.EXPENSE,
-        category_path=["Transport"],
-        container_ids=[str(cashbox2.id)],
-        amount_patterns=[{
-            "amount": 50000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
-    )
-    assert root2 is not None
-    assert root2.container_ids == [str(cashbox2.id)]
-
-
-def test_different_directions_dont_interfere(
+    assert exc_info.value.message == ANCESTOR_POOL_SUBSET_ERROR
+
+
+@pytest.mark.parametrize(
+    "first,second",
+    [
+        # Root-level posts (category_path length 1) have no ancestor constraint
+        (
+            (BudgetPostDirection.EXPENSE, ["Food"], ("cashbox1",), 100000),
+            (BudgetPostDirection.EXPENSE, ["Transport"], ("cashbox2",), 50000),
+        ),
+        # Same path in another direction is an independent hierarchy
+        (
+            (BudgetPostDirection.INCOME, ["Salary"], ("cashbox1",), 500000),
+            (BudgetPostDirection.EXPENSE, ["Salary"], ("cashbox2", "cashbox3"), 100000),
+        ),
+    ],
+    ids=["root_level", "different_directions"],
+)
+def test_unrelated_posts_have_independent_pools(
     db: Session,
     test_budget: Budget,
     test_user: User,
-    cashbox1: Container,
-    cashbox2: Container,
-    cashbox3: Container,
+    containers: SimpleNamespace,
+    first: tuple,
+    second: tuple,
 ):
-    """Income post at ['Salary'] with containers [A]. Expense post at ['Salary'] with containers [B, C]. Should succeed - different directions are independent hierarchies."""
-    # Income post with cashbox1
-    income_post, _ = create_budget_post(
-        db=db,
-        budget_id=test_budget.id,
-        user_id=test_user.id,
-        direction=BudgetPostDirection.INCOME,
-        category_path=["Salary"],
-        container_ids=[str(cashbox1.id)],
-        amount_patterns=[{
-            "amount": 500000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
-    )
-    assert income_post is not None
-    assert income_post.container_ids == [str(cashbox1.id)]
-
-    # Expense post at same category path but different direction - should succeed with different containers
-    expense_post, _ = create_budget_post(
-        db=db,
-        budget_id=test_budget.id,
-        user_id=test_user.id,
-        direction=BudgetPostDirection.EXPENSE,
-        category_path=["Salary"],
-        container_ids=[str(cashbox2.id), str(cashbox3.id)],
-        amount_patterns=[{
-            "amount": 100000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
-    )
-    assert expense_post is not None
-    assert set(expense_post.container_ids) == {str(cashbox2.id), str(cashbox3.id)}
+    """Posts without a common ancestor in the same direction can use disjoint containers."""
+    for direction, category_path, container_keys, amount in (first, second):
+        container_ids = [getattr(containers, key) for key in container_keys]
+        post, _ = create_budget_post(
+            db=db,
+            budget_id=test_budget.id,
+            user_id=test_user.id,
+            direction=direction,
+            category_path=category_path,
+            container_ids=container_ids,
+            amount_patterns=_patterns(amount),
+        )
+        assert post is not None
+        assert post.container_ids == container_ids
 
 
 def test_update_child_superset_rejected(
     db: Session,
     test_budget: Budget,
     test_user: User,
-    cashbox1: Container,
-    cashbox2: Container,
-    cashbox3: Container,
+    containers: SimpleNamespace,
 ):
     """Create parent with [A, B]. Create child with [A]. Try to UPDATE child to [A, B, C] -> rejected because [C] is not in parent's pool."""
     # Parent with cashbox1, cashbox2
@@ -666,12 +488,8 @@ def test_update_child_superset_rejected(
         user_id=test_user.id,
         direction=BudgetPostDirection.EXPENSE,
         category_path=["Food"],
-        container_ids=[str(cashbox1.id), str(cashbox2.id)],
-        amount_patterns=[{
-            "amount": 100000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
+        container_ids=[containers.cashbox1, containers.cashbox2],
+        amount_patterns=_patterns(100000),
     )
     assert parent is not None
 
@@ -682,12 +500,8 @@ def test_update_child_superset_rejected(
         user_id=test_user.id,
         direction=BudgetPostDirection.EXPENSE,
         category_path=["Food", "Groceries"],
-        container_ids=[str(cashbox1.id)],
-        amount_patterns=[{
-            "amount": 50000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
+        container_ids=[containers.cashbox1],
+        amount_patterns=_patterns(50000),
     )
     assert child is not None
 
@@ -698,17 +512,16 @@ def test_update_child_superset_rejected(
             post_id=child.id,
             budget_id=test_budget.id,
             user_id=test_user.id,
-            container_ids=[str(cashbox1.id), str(cashbox2.id), str(cashbox3.id)],
+            container_ids=[containers.cashbox1, containers.cashbox2, containers.cashbox3],
         )
-    assert "must be a subset of ancestor" in exc_info.value.message
+    assert exc_info.value.message == ANCESTOR_POOL_SUBSET_ERROR
 
 
 def test_empty_intersection_fallback(
     db: Session,
     test_budget: Budget,
     test_user: User,
-    cashbox1: Container,
-    cashbox2: Container,
+    containers: SimpleNamespace,
 ):
     """Create parent with [A, B]. Create child with [B]. Update parent to [A] (removing B). Child's pool intersection with [A] is empty, so child should fallback to parent's full new pool [A]."""
     # Parent with cashbox1, cashbox2
@@ -718,12 +531,8 @@ def test_empty_intersection_fallback(
         user_id=test_user.id,
         direction=BudgetPostDirection.EXPENSE,
         category_path=["Food"],
-        container_ids=[str(cashbox1.id), str(cashbox2.id)],
-        amount_patterns=[{
-            "amount": 100000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
+        container_ids=[containers.cashbox1, containers.cashbox2],
+        amount_patterns=_patterns(100000),
     )
     assert parent is not None
 
@@ -734,12 +543,8 @@ def test_empty_intersection_fallback(
         user_id=test_user.id,
         direction=BudgetPostDirection.EXPENSE,
         category_path=["Food", "Groceries"],
-        container_ids=[str(cashbox2.id)],
-        amount_patterns=[{
-            "amount": 50000,
-            "start_date": "2026-01-01",
-            "end_date": None,
-        }],
+        container_ids=[containers.cashbox2],
+        amount_patterns=_patterns(50000),
     )
     assert child is not None
 
@@ -749,14 +554,37 @@ def test_empty_intersection_fallback(
         post_id=parent.id,
         budget_id=test_budget.id,
         user_id=test_user.id,
-        container_ids=[str(cashbox1.id)],
+        container_ids=[containers.cashbox1],
     )
 
     # Child should be cascaded - intersection is empty, so gets parent's full new pool
     assert len(affected) == 1
     assert affected[0]["post_id"] == str(child.id)
-    assert affected[0]["old_container_ids"] == [str(cashbox2.id)]
-    assert affected[0]["new_container_ids"] == [str(cashbox1.id)]
+    assert affected[0]["old_container_ids"] == [containers.cashbox2]
+    assert affected[0]["new_container_ids"] == [containers.cashbox1]
 
     db.refresh(child)
-    assert child.container_ids == [str(cashbox1.id)]
+    assert child.container_ids == [containers.cashbox1]
+
+
+def test_create_validates_container_pool_in_one_query(
+    db: Session,
+    test_budget: Budget,
+    test_user: User,
+    containers: SimpleNamespace,
+    count_queries,
+):
+    """All pool containers are looked up together, not one SELECT per container."""
+    with count_queries() as queries:
+        post, _ = create_budget_post(
+            db=db,
+            budget_id=test_budget.id,
+            user_id=test_user.id,
+            direction=BudgetPostDirection.EXPENSE,
+            category_path=["Food"],
+            container_ids=[containers.cashbox1, containers.cashbox2, containers.cashbox3],
+            amount_patterns=_patterns(100000),
+        )
+
+    assert post is not None
+    assert len([q for q in queries if "FROM containers" in q]) == 1
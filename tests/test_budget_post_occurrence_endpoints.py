@@ -1,8 +1,9 @@
 """Tests for budget post occurrence API endpoints."""
 
 import pytest
+from calendar import monthrange
 from datetime import date
-from uuid import uuid4
+from uuid import UUID
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session as DBSession
 
@@ -13,321 +14,183 @@ from api.models.amount_pattern import AmountPattern
 from api.schemas.budget_post import RecurrenceType, RelativePosition
 
 
+# Id that matches no budget or budget post
+MISSING_ID = UUID(int=0)
+
+# Posts need a container pool, but occurrence expansion never reads it
+DUMMY_CONTAINER_ID = "00000000-0000-4000-8000-000000000001"
+
+# Recurrence patterns shared across tests (never mutated)
+WEEKLY_FRIDAY = {"type": RecurrenceType.WEEKLY.value, "weekday": 4, "interval": 1}
+MONTHLY_FIRST = {"type": RecurrenceType.MONTHLY_FIXED.value, "day_of_month": 1, "interval": 1}
+DAILY = {"type": RecurrenceType.DAILY.value, "interval": 1}
+
+
 @pytest.fixture
 def test_budget(db: DBSession, test_user):
-    """Create a test budget."""
+    """Create a test budget (flushed; make_budget_post or the test owns the commit)."""
     budget = Budget(
         name="Test Budget",
         owner_id=test_user.id,
     )
     db.add(budget)
-    db.commit()
-    db.refresh(budget)
+    db.flush()
     return budget
 
 
+def _current_month_days() -> list[str]:
+    """ISO dates of every day in the current month (the endpoints' default range)."""
+    today = date.today()
+    days_in_month = monthrange(today.year, today.month)[1]
+    return [date(today.year, today.month, day).isoformat() for day in range(1, days_in_month + 1)]
+
+
+def build_budget_post(
+    budget: Budget,
+    recurrence_pattern: dict,
+    amount: int = 5000,
+    category_path: list[str] | None = None,
+    display_order: list[int] | None = None,
+) -> BudgetPost:
+    """Build (not add) an expense budget post with one amount pattern from 2026-02-01."""
+    return BudgetPost(
+        budget_id=budget.id,
+        category_path=category_path or ["Test", "Category"],
+        display_order=display_order or [0, 0],
+        direction=BudgetPostDirection.EXPENSE,
+        accumulate=False,
+        container_ids=[DUMMY_CONTAINER_ID],
+        amount_patterns=[
+            AmountPattern(
+                amount=amount,
+                start_date=date(2026, 2, 1),
+                end_date=None,
+                recurrence_pattern=recurrence_pattern,
+            )
+        ],
+    )
 
 
-class TestGetBudgetPostOccurrences:
-    """Test GET /api/budgets/{budget_id}/budget-posts/{post_id}/occurrences endpoint."""
-
-    def test_get_occurrences_weekly(self, client, db, auth_headers, test_budget):
-        """Get occurrences for weekly budget post."""
-        # Create budget post with weekly recurrence (every Friday)
-        budget_post = BudgetPost(
-            budget_id=test_budget.id,
-            category_path=["Test", "Category"],
-        display_order=[0, 0],
-            direction=BudgetPostDirection.EXPENSE,
-            accumulate=False,
-            container_ids=[str(uuid4())],  # Dummy account
-        )
+@pytest.fixture
+def make_budget_post(db: DBSession, test_budget):
+    """
+    Factory that adds a build_budget_post() to test_budget.
+
+    Post and pattern are inserted in a single flush and commit.
+    """
+    def _make(recurrence_pattern: dict, **kwargs) -> BudgetPost:
+        budget_post = build_budget_post(test_budget, recurrence_pattern, **kwargs)
         db.add(budget_post)
         db.commit()
+        return budget_post
 
-        # Add amount pattern
-        pattern = AmountPattern(
-            budget_post_id=budget_post.id,
-            amount=5000,  # 50 kr
-            start_date=date(2026, 2, 1),
-            end_date=None,
-            recurrence_pattern={
-                "type": RecurrenceType.WEEKLY.value,
-                "weekday": 4,  # Friday
-                "interval": 1
-            }
-        )
-        db.add(pattern)
-        db.commit()
-        db.refresh(budget_post)
+    return _make
 
-        # Request occurrences for February 2026
-        response = client.get(
-            f"/api/budgets/{test_budget.id}/budget-posts/{budget_post.id}/occurrences",
-            params={
-                "from_date": "2026-02-01",
-                "to_date": "2026-02-28"
-            },
-            headers=auth_headers
-        )
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["budget_post_id"] == str(budget_post.id)
-        assert len(data["occurrences"]) == 4  # 4 Fridays in Feb 2026
-
-        # Check first occurrence
-        assert data["occurrences"][0]["date"] == "2026-02-06"
-        assert data["occurrences"][0]["amount"] == 5000
-
-    def test_get_occurrences_monthly_fixed(self, client, db, auth_headers, test_budget):
-        """Get occurrences for monthly fixed budget post."""
-        budget_post = BudgetPost(
-            budget_id=test_budget.id,
-            category_path=["Test", "Category"],
-        display_order=[0, 0],
-            direction=BudgetPostDirection.EXPENSE,
-            accumulate=False,
-            container_ids=[str(uuid4())],  # Dummy account
-        )
-        db.add(budget_post)
-        db.commit()
-
-        # Add amount pattern
-        pattern = AmountPattern(
-            budget_post_id=budget_post.id,
-            amount=800000,  # 8000 kr
-            start_date=date(2026, 2, 1),
-            end_date=None,
-            recurrence_pattern={
-                "type": RecurrenceType.MONTHLY_FIXED.value,
-                "day_of_month": 1,
-                "interval": 1
-            }
-        )
-        db.add(pattern)
-        db.commit()
-        db.refresh(budget_post)
+class TestGetBudgetPostOccurrences:
+    """Test GET /api/budgets/{budget_id}/budget-posts/{post_id}/occurrences endpoint."""
 
-        # Request occurrences for Feb-Apr 2026
-        response = client.get(
+    @pytest.mark.parametrize(
+        "recurrence_pattern,amount,to_date,expected_dates",
+        [
+            pytest.param(
+                WEEKLY_FRIDAY,
+                5000,  # 50 kr
+                "2026-02-28",
+                ["2026-02-06", "2026-02-13", "2026-02-20", "2026-02-27"],
+                id="weekly",
+            ),
+            pytest.param(
+                MONTHLY_FIRST,
+                800000,  # 8000 kr
+                "2026-04-30",
+                ["2026-02-01", "2026-03-01", "2026-04-01"],
+                id="monthly_fixed",
+            ),
+            pytest.param(
+                MONTHLY_FIRST,
+                300000,  # 3000 kr, ceiling-style amount comes straight from the pattern
+                "2026-02-28",
+                ["2026-02-01"],
+                id="pattern_amount",
+            ),
+            pytest.param(
+                {**MONTHLY_FIRST, "bank_day_adjustment": "next"},
+                800000,
+                "2026-02-28",
+                ["2026-02-02"],  # Feb 1, 2026 is a Sunday -> Monday Feb 2
+                id="bank_day_next",
+            ),
+        ],
+    )
+    async def test_get_occurrences(
+        self, authenticated_async_client, test_budget, make_budget_post,
+        recurrence_pattern, amount, to_date, expected_dates,
+    ):
+        """Occurrences from 2026-02-01 follow the post's recurrence and amount."""
+        budget_post = make_budget_post(recurrence_pattern=recurrence_pattern, amount=amount)
+
+        response = await authenticated_async_client.get(
             f"/api/budgets/{test_budget.id}/budget-posts/{budget_post.id}/occurrences",
             params={
                 "from_date": "2026-02-01",
-                "to_date": "2026-04-30"
+                "to_date": to_date
             },
-            headers=auth_headers
         )
 
         assert response.status_code == 200
         data = response.json()
-        assert len(data["occurrences"]) == 3  # Feb, Mar, Apr
-        assert data["occurrences"][0]["date"] == "2026-02-01"
-        assert data["occurrences"][1]["date"] == "2026-03-01"
-        assert data["occurrences"][2]["date"] == "2026-04-01"
+        assert data["budget_post_id"] == str(budget_post.id)
+        assert [o["date"] for o in data["occurrences"]] == expected_dates
+        assert all(o["amount"] == amount for o in data["occurrences"])
 
-    def test_get_occurrences_default_current_month(self, client, db, auth_headers, test_budget):
+    async def test_get_occurrences_default_current_month(self, authenticated_async_client, test_budget, make_budget_post):
         """Get occurrences defaults to current month when dates not provided."""
-        budget_post = BudgetPost(
-            budget_id=test_budget.id,
-            category_path=["Test", "Category"],
-        display_order=[0, 0],
-            direction=BudgetPostDirection.EXPENSE,
-            accumulate=False,
-            container_ids=[str(uuid4())],  # Dummy account
-        )
-        db.add(budget_post)
-        db.commit()
-
-        # Add amount pattern
-        pattern = AmountPattern(
-            budget_post_id=budget_post.id,
+        budget_post = make_budget_post(
+            recurrence_pattern=DAILY,
             amount=1000,
-            start_date=date(2026, 2, 1),
-            end_date=None,
-            recurrence_pattern={
-                "type": RecurrenceType.DAILY.value,
-                "interval": 1
-            }
         )
-        db.add(pattern)
-        db.commit()
-        db.refresh(budget_post)
 
         # Request without date params (should default to current month)
-        response = client.get(
-            f"/api/budgets/{test_budget.id}/budget-posts/{budget_post.id}/occurrences",
-            headers=auth_headers
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        # Should have occurrences for current month
-        assert len(data["occurrences"]) > 0
-
-    def test_get_occurrences_ceiling_type_uses_max_amount(self, client, db, auth_headers, test_budget):
-        """Ceiling type budget posts use amount from patterns."""
-        budget_post = BudgetPost(
-            budget_id=test_budget.id,
-            category_path=["Test", "Category"],
-        display_order=[0, 0],
-            direction=BudgetPostDirection.EXPENSE,
-            accumulate=False,
-            container_ids=[str(uuid4())],  # Dummy account
-        )
-        db.add(budget_post)
-        db.commit()
-
-        # Add amount pattern with maximum amount
-        pattern = AmountPattern(
-            budget_post_id=budget_post.id,
-            amount=300000,  # 3000 kr
-            start_date=date(2026, 2, 1),
-            end_date=None,
-            recurrence_pattern={
-                "type": RecurrenceType.MONTHLY_FIXED.value,
-                "day_of_month": 1,
-                "interval": 1
-            }
-        )
-        db.add(pattern)
-        db.commit()
-        db.refresh(budget_post)
-
-        response = client.get(
-            f"/api/budgets/{test_budget.id}/budget-posts/{budget_post.id}/occurrences",
-            params={
-                "from_date": "2026-02-01",
-                "to_date": "2026-02-28"
-            },
-            headers=auth_headers
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        # Should use amount from pattern (300000)
-        assert data["occurrences"][0]["amount"] == 300000
-
-    def test_get_occurrences_with_bank_day_adjustment(self, client, db, auth_headers, test_budget):
-        """Occurrences on weekends are adjusted to next bank day."""
-        budget_post = BudgetPost(
-            budget_id=test_budget.id,
-            category_path=["Test", "Category"],
-        display_order=[0, 0],
-            direction=BudgetPostDirection.EXPENSE,
-            accumulate=False,
-            container_ids=[str(uuid4())],  # Dummy account
-        )
-        db.add(budget_post)
-        db.commit()
-
-        # Add amount pattern with bank_day_adjustment
-        pattern = AmountPattern(
-            budget_post_id=budget_post.id,
-            amount=800000,
-            start_date=date(2026, 2, 1),
-            end_date=None,
-            recurrence_pattern={
-                "type": RecurrenceType.MONTHLY_FIXED.value,
-                "day_of_month": 1,
-                "interval": 1,
-                "bank_day_adjustment": "next"
-            }
-        )
-        db.add(pattern)
-        db.commit()
-        db.refresh(budget_post)
-
-        # Feb 1, 2026 is a Sunday
-        response = client.get(
+        response = await authenticated_async_client.get(
             f"/api/budgets/{test_budget.id}/budget-posts/{budget_post.id}/occurrences",
-            params={
-                "from_date": "2026-02-01",
-                "to_date": "2026-02-28"
-            },
-            headers=auth_headers
         )
 
         assert response.status_code == 200
         data = response.json()
-        # Should be adjusted to Monday Feb 2
-        assert data["occurrences"][0]["date"] == "2026-02-02"
+        # The daily pattern is open-ended from 2026-02-01, so every day of the current month
+        assert [o["date"] for o in data["occurrences"]] == _current_month_days()
 
-    def test_get_occurrences_not_found(self, client, auth_headers, test_budget):
+    async def test_get_occurrences_not_found(self, authenticated_async_client, test_budget):
         """Returns 404 for non-existent budget post."""
-        fake_id = "00000000-0000-0000-0000-000000000000"
-        response = client.get(
-            f"/api/budgets/{test_budget.id}/budget-posts/{fake_id}/occurrences",
-            headers=auth_headers
+        response = await authenticated_async_client.get(
+            f"/api/budgets/{test_budget.id}/budget-posts/{MISSING_ID}/occurrences",
         )
 
         assert response.status_code == 404
 
-    def test_get_occurrences_invalid_date_format(self, client, db, auth_headers, test_budget):
+    async def test_get_occurrences_invalid_date_format(self, authenticated_async_client, test_budget, make_budget_post):
         """Returns 422 for invalid date format."""
-        budget_post = BudgetPost(
-            budget_id=test_budget.id,
-            category_path=["Test", "Category"],
-        display_order=[0, 0],
-            direction=BudgetPostDirection.EXPENSE,
-            accumulate=False,
-            container_ids=[str(uuid4())],  # Dummy account
-        )
-        db.add(budget_post)
-        db.commit()
-
-        # Add amount pattern
-        pattern = AmountPattern(
-            budget_post_id=budget_post.id,
+        budget_post = make_budget_post(
+            recurrence_pattern=DAILY,
             amount=5000,
-            start_date=date(2026, 2, 1),
-            end_date=None,
-            recurrence_pattern={
-                "type": RecurrenceType.DAILY.value
-            }
         )
-        db.add(pattern)
-        db.commit()
-        db.refresh(budget_post)
 
-        response = client.get(
+        response = await authenticated_async_client.get(
             f"/api/budgets/{test_budget.id}/budget-posts/{budget_post.id}/occurrences",
             params={
                 "from_date": "01-02-2026",  # Wrong format
                 "to_date": "2026-02-28"
             },
-            headers=auth_headers
         )
 
         assert response.status_code == 422
 
-    def test_get_occurrences_unauthorized(self, client, test_budget, db):
+    async def test_get_occurrences_unauthorized(self, async_client):
         """Returns 401 without authentication."""
-        budget_post = BudgetPost(
-            budget_id=test_budget.id,
-            category_path=["Test", "Category"],
-        display_order=[0, 0],
-            direction=BudgetPostDirection.EXPENSE,
-            accumulate=False,
-            container_ids=[str(uuid4())],  # Dummy account
-        )
-        db.add(budget_post)
-        db.commit()
-
-        # Add amount pattern
-        pattern = AmountPattern(
-            budget_post_id=budget_post.id,
-            amount=5000,
-            start_date=date(2026, 2, 1),
-            end_date=None,
-            recurrence_pattern={"type": RecurrenceType.DAILY.value}
-        )
-        db.add(pattern)
-        db.commit()
-        db.refresh(budget_post)
-
-        response = client.get(
-            f"/api/budgets/{test_budget.id}/budget-posts/{budget_post.id}/occurrences"
+        # Authentication is checked before any lookup, so the ids need not exist
+        response = await async_client.get(
+            f"/api/budgets/{MISSING_ID}/budget-posts/{MISSING_ID}/occurrences"
         )
 
         assert response.status_code == 401
@@ -336,64 +199,33 @@ class TestGetBudgetPostOccurrences:
 class TestGetBulkBudgetPostOccurrences:
     """Test GET /api/budgets/{budget_id}/budget-posts/occurrences endpoint."""
 
-    def test_get_bulk_occurrences(self, client, db, auth_headers, test_budget):
+    async def test_get_bulk_occurrences(self, authenticated_async_client, db, test_budget):
         """Get occurrences for all budget posts in a budget."""
-        # Create multiple budget posts
-        post1 = BudgetPost(
-            budget_id=test_budget.id,
+        # Create multiple budget posts (one flush inserts both posts and patterns)
+        post1 = build_budget_post(
+            test_budget,
+            MONTHLY_FIRST,
+            amount=800000,
             category_path=["Udgift", "Husleje"],
             display_order=[0, 0],
-            direction=BudgetPostDirection.EXPENSE,
-            accumulate=False,
-            container_ids=[str(uuid4())],  # Dummy account
         )
-        post2 = BudgetPost(
-            budget_id=test_budget.id,
+        post2 = build_budget_post(
+            test_budget,
+            WEEKLY_FRIDAY,
+            amount=5000,
             category_path=["Udgift", "Opsparing"],
             display_order=[0, 1],
-            direction=BudgetPostDirection.EXPENSE,
-            accumulate=False,
-            container_ids=[str(uuid4())],  # Dummy account
         )
         db.add_all([post1, post2])
         db.commit()
 
-        # Add amount patterns
-        pattern1 = AmountPattern(
-            budget_post_id=post1.id,
-            amount=800000,
-            start_date=date(2026, 2, 1),
-            end_date=None,
-            recurrence_pattern={
-                "type": RecurrenceType.MONTHLY_FIXED.value,
-                "day_of_month": 1,
-                "interval": 1
-            }
-        )
-        pattern2 = AmountPattern(
-            budget_post_id=post2.id,
-            amount=5000,
-            start_date=date(2026, 2, 1),
-            end_date=None,
-            recurrence_pattern={
-                "type": RecurrenceType.WEEKLY.value,
-                "weekday": 4,  # Friday
-                "interval": 1
-            }
-        )
-        db.add_all([pattern1, pattern2])
-        db.commit()
-        db.refresh(post1)
-        db.refresh(post2)
-
         # Request bulk occurrences for February 2026
-        response = client.get(
+        response = await authenticated_async_client.get(
             f"/api/budgets/{test_budget.id}/budget-posts/occurrences",
             params={
                 "from_date": "2026-02-01",
                 "to_date": "2026-02-28"
             },
-            headers=auth_headers
         )
 
         assert response.status_code == 200
@@ -412,87 +244,63 @@ class TestGetBulkBudgetPostOccurrences:
         # Savings: 4 Fridays in Feb
         assert len(savings_data["occurrences"]) == 4
 
-    def test_get_bulk_occurrences_empty_budget(self, client, auth_headers, test_budget):
+    async def test_get_bulk_occurrences_empty_budget(self, authenticated_async_client, test_budget):
         """Returns empty list for budget with no budget posts."""
-        response = client.get(
+        response = await authenticated_async_client.get(
             f"/api/budgets/{test_budget.id}/budget-posts/occurrences",
             params={
                 "from_date": "2026-02-01",
                 "to_date": "2026-02-28"
             },
-            headers=auth_headers
         )
 
         assert response.status_code == 200
         data = response.json()
         assert len(data["data"]) == 0
 
-    def test_get_bulk_occurrences_default_current_month(self, client, db, auth_headers, test_budget):
+    async def test_get_bulk_occurrences_default_current_month(self, authenticated_async_client, test_budget, make_budget_post):
         """Bulk occurrences default to current month when dates not provided."""
-        post = BudgetPost(
-            budget_id=test_budget.id,
-            category_path=["Test", "Category"],
-        display_order=[0, 0],
-            direction=BudgetPostDirection.EXPENSE,
-            accumulate=False,
-            container_ids=[str(uuid4())],  # Dummy account
-        )
-        db.add(post)
-        db.commit()
-
-        # Add amount pattern
-        pattern = AmountPattern(
-            budget_post_id=post.id,
+        post = make_budget_post(
+            recurrence_pattern=DAILY,
             amount=1000,
-            start_date=date(2026, 2, 1),
-            end_date=None,
-            recurrence_pattern={
-                "type": RecurrenceType.DAILY.value,
-                "interval": 1
-            }
         )
-        db.add(pattern)
-        db.commit()
 
         # Request without date params
-        response = client.get(
+        response = await authenticated_async_client.get(
             f"/api/budgets/{test_budget.id}/budget-posts/occurrences",
-            headers=auth_headers
         )
 
         assert response.status_code == 200
         data = response.json()
         assert len(data["data"]) == 1
-        # Should have occurrences for current month
-        assert len(data["data"][0]["occurrences"]) > 0
+        assert data["data"][0]["budget_post_id"] == str(post.id)
+        # The daily pattern is open-ended from 2026-02-01, so every day of the current month
+        assert [o["date"] for o in data["data"][0]["occurrences"]] == _current_month_days()
 
-    def test_get_bulk_occurrences_unauthorized(self, client, test_budget):
+    async def test_get_bulk_occurrences_unauthorized(self, async_client):
         """Returns 401 without authentication."""
-        response = client.get(
-            f"/api/budgets/{test_budget.id}/budget-posts/occurrences"
+        response = await async_client.get(
+            f"/api/budgets/{MISSING_ID}/budget-posts/occurrences"
         )
 
         assert response.status_code == 401
 
-    def test_get_bulk_occurrences_budget_not_found(self, client, auth_headers):
+    async def test_get_bulk_occurrences_budget_not_found(self, authenticated_async_client):
         """Returns 404 for non-existent budget."""
-        fake_id = "00000000-0000-0000-0000-000000000000"
-        response = client.get(
-            f"/api/budgets/{fake_id}/budget-posts/occurrences",
-            headers=auth_headers
+        response = await authenticated_async_client.get(
+            f"/api/budgets/{MISSING_ID}/budget-posts/occurrences",
         )
 
         assert response.status_code == 404
 
-    def test_get_bulk_occurrences_invalid_date(self, client, auth_headers, test_budget):
+    async def test_get_bulk_occurrences_invalid_date(self, authenticated_async_client, test_budget):
         """Returns 422 for invalid date format."""
-        response = client.get(
+        response = await authenticated_async_client.get(
             f"/api/budgets/{test_budget.id}/budget-posts/occurrences",
             params={
                 "from_date": "invalid-date",
                 "to_date": "2026-02-28"
             },
-            headers=auth_headers
         )
 
         assert response.status_code == 422
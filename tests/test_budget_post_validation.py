@@ -26,7 +26,6 @@ def test_user(db: Session) -> User:
     )
     db.add(user)
     db.commit()
-    db.refresh(user)
     return user
 
 
@@ -41,7 +40,6 @@ def test_budget(db: Session, test_user: User) -> Budget:
     )
     db.add(budget)
     db.commit()
-    db.refresh(budget)
     return budget
 
 
@@ -58,7 +56,6 @@ def cashbox_container(db: Session, test_budget: Budget, test_user: User) -> Cont
     )
     db.add(container)
     db.commit()
-    db.refresh(container)
     return container
 
 
@@ -75,7 +72,6 @@ def cashbox_container2(db: Session, test_budget: Budget, test_user: User) -> Con
     )
     db.add(container)
     db.commit()
-    db.refresh(container)
     return container
 
 
@@ -92,7 +88,6 @@ def piggybank_container(db: Session, test_budget: Budget, test_user: User) -> Co
     )
     db.add(container)
     db.commit()
-    db.refresh(container)
     return container
 
 
@@ -109,7 +104,6 @@ def debt_container(db: Session, test_budget: Budget, test_user: User) -> Contain
     )
     db.add(container)
     db.commit()
-    db.refresh(container)
     return container
 
 
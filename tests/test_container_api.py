@@ -22,7 +22,6 @@ def test_budget(db: DBSession, test_user: User) -> Budget:
     )
     db.add(budget)
     db.commit()
-    db.refresh(budget)
     return budget
 
 
@@ -37,7 +36,6 @@ def other_budget(db: DBSession, other_user: User) -> Budget:
     )
     db.add(budget)
     db.commit()
-    db.refresh(budget)
     return budget
 
 
@@ -55,7 +53,6 @@ def test_container(db: DBSession, test_budget: Budget, test_user: User) -> Conta
     )
     db.add(container)
     db.commit()
-    db.refresh(container)
     return container
 
 
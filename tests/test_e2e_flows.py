@@ -12,30 +12,10 @@ This test file covers the main happy paths through the application:
 These are API-level E2E tests that verify the backend flows work correctly.
 """
 
-import pytest
 from datetime import date
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
-from api.main import app
-from api.deps.database import get_db
-
-
-@pytest.fixture
-def client(db: Session):
-    """Create test client with overridden database dependency."""
-
-    def override_get_db():
-        try:
-            yield db
-        finally:
-            pass
-
-    app.dependency_overrides[get_db] = override_get_db
-    client = TestClient(app)
-    yield client
-    app.dependency_overrides.clear()
-
 
 def test_complete_user_flow(client: TestClient, db: Session):
     """
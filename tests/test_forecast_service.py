@@ -29,7 +29,6 @@ def test_budget(db: Session, test_user: User):
     )
     db.add(budget)
     db.commit()
-    db.refresh(budget)
     return budget
 
 
@@ -48,7 +47,6 @@ def test_container(db: Session, test_budget: Budget, test_user: User):
     )
     db.add(container)
     db.commit()
-    db.refresh(container)
     return container
 
 
@@ -28,7 +28,6 @@ def test_user(db: DBSession) -> User:
     )
     db.add(user)
     db.commit()
-    db.refresh(user)
     return user
 
 
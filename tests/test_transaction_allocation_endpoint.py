@@ -25,7 +25,6 @@ def test_budget(db: Session, test_user: User) -> Budget:
     )
     db.add(budget)
     db.commit()
-    db.refresh(budget)
     return budget
 
 
@@ -43,7 +42,6 @@ def test_container(db: Session, test_budget: Budget, test_user: User) -> Contain
     )
     db.add(container)
     db.commit()
-    db.refresh(container)
     return container
 
 
@@ -124,7 +122,6 @@ def test_transaction(db: Session, test_container: Account, test_user: User) -> T
     )
     db.add(transaction)
     db.commit()
-    db.refresh(transaction)
     return transaction
 
 
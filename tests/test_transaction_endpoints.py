@@ -24,7 +24,6 @@ def test_budget(db: Session, test_user: User) -> Budget:
     )
     db.add(budget)
     db.commit()
-    db.refresh(budget)
     return budget
 
 
@@ -43,7 +42,6 @@ def test_container(db: Session, test_budget: Budget, test_user: User) -> Contain
     )
     db.add(container)
     db.commit()
-    db.refresh(container)
     return container
 
 
@@ -62,7 +60,6 @@ def second_container(db: Session, test_budget: Budget, test_user: User) -> Conta
     )
     db.add(container)
     db.commit()
-    db.refresh(container)
     return container
 
 
@@ -513,8 +510,8 @@ def test_delete_internal_transfer_deletes_both(
     assert response.status_code == 204
 
     # Verify both transactions are deleted (need fresh query after expiration)
-    assert db.query(Transaction).filter(Transaction.id == transaction1_id).first() is None
-    assert db.query(Transaction).filter(Transaction.id == transaction2_id).first() is None
+    assert db.get(Transaction, transaction1_id) is None
+    assert db.get(Transaction, transaction2_id) is None
 
 
 def test_create_transaction_invalid_account(